@@ -0,0 +1,73 @@
+import numpy as np
+
+from sigsys.continuous import ContinuousSignal, LTIContinuous
+
+
+def main():
+    # Define a continuous signal
+    # def func(t):
+    #     return np.sin(t)
+
+    # signal = ContinuousSignal(func)
+    # signal.plot()
+
+    # # Shift the signal
+    # shifted_signal = signal.shift(2)
+    # shifted_signal.plot()
+
+    # # Add two signals
+    # added_signal = signal.add(shifted_signal)
+    # added_signal.plot()
+
+    # # Multiply two signals
+    # multiplied_signal = signal.multiply(shifted_signal)
+    # multiplied_signal.plot()
+
+    # # Multiply the signal by a constant factor
+    # scaled_signal = signal.multiply_const_factor(2)
+    # scaled_signal.plot()
+    # impulse_response_func = lambda t : 1 * (t >= 0)
+    # impulse_response = ContinuousSignal(impulse_response_func, INF=3)
+    # impulse_response.plot()
+
+    # lti_system = LTIContinuous(impulse_response)
+        # Define an example impulse response (e.g., exponential decay)
+    impulse_response_func = lambda t: 1 * (t >= 0)
+    impulse_response = ContinuousSignal(impulse_response_func, INF=3)
+    impulse_response.plot("Impulse response")
+
+    # Create an LTI Continuous system
+    lti_system = LTIContinuous(impulse_response)
+
+    # Define an example input signal (e.g., sine wave)
+    input_signal_func = lambda t: np.exp(-t) * (t >= 0)
+    input_signal = ContinuousSignal(input_signal_func, INF=3)
+    input_signal.plot("Input Signal")
+
+    # # Define an output signal
+    # t = np.linspace(-5, 5, 500)
+    # output_signal_func = np.piecewise(t, [t < 0, t >= 0], [0, lambda t: 1 - np.exp(-t)])
+    output_signal_func = lambda t: (1 - np.exp(-t)) * (t >= 0)
+    output_signal = ContinuousSignal(output_signal_func, INF=3)
+    output_signal.plot("Output Signal")
+
+    # Same system with closed-form signals: the output is exact, no delta needed
+    from sigsys.analytic import unit_step, exponential
+    exact_output = LTIContinuous(unit_step(3)).output(exponential(3, -1.0))
+    t_values = np.linspace(-3, 3, 5000)
+    print("Closed form max error:", np.max(np.abs(exact_output.func(t_values) - output_signal_func(t_values))))
+
+
+    lti_system.impulse_multiplied_by_coefficients_plot(input_signal, 0.5)
+
+    Deltas = [0.5, 0.1, 0.05,0.01]
+    lti_system.reconstructed_plot(input_signal, Deltas)
+    lti_system.response_of_impulse_plot(impulse_response,input_signal, 0.5)
+    lti_system.reconstructed_output_plot(input_signal,output_signal, Deltas)
+
+    # lti_system.impulse_multiplied_by_coefficients_plot(impulse_response, 0.5)
+        
+
+
+if __name__ == '__main__':
+        main()
@@ -0,0 +1,32 @@
+import sys
+
+from sigsys.batch import run_batch, print_results_table
+
+from task1 import functions, frequencies_list, sampled_times
+
+
+def render_results(results, sampled_times=sampled_times):
+    """
+    Draw the task1 figures for results produced by run_batch. Kept separate from the
+    sweep so the expensive part can run headless.
+    """
+    from task1 import plot_original, plot_spectrum, plot_reconstruction
+
+    plotted = set()
+    for row in results:
+        if row["function"] not in plotted:
+            plot_original(row["function"], sampled_times, row["original"])
+            plotted.add(row["function"])
+        plot_spectrum(row["function"], row["frequencies"], row["spectrum"])
+        plot_reconstruction(row["function"], row["frequencies"], sampled_times, row["original"], row["reconstructed"])
+
+
+def main():
+    results = run_batch(functions, frequencies_list, sampled_times)
+    print_results_table(results)
+    if "--plot" in sys.argv:
+        render_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import asyncio
+import os
+import sys
+
+import numpy as np
+
+from sigsys.streaming import CollectSink, StreamingHighPass, replay_source, run_stream
+from sigsys.wav_io import load_normalized_mono
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+async def denoise_live(path, threshold_frequency=1000, frame_size=256, latency_budget=0.05, realtime=True):
+    """
+    The task2 high-pass run on buzzjc.wav as if it were live input: the file is replayed
+    frame by frame at its sample rate and filtered as the frames arrive.
+    """
+    sample_rate, data = load_normalized_mono(path)
+    sink = CollectSink()
+    stats = await run_stream(
+        replay_source(data, frame_size, sample_rate, realtime),
+        sink,
+        StreamingHighPass(sample_rate, threshold_frequency),
+        sample_rate,
+        frame_size,
+        latency_budget,
+    )
+    return sample_rate, sink.to_array(), stats
+
+
+def main():
+    sample_rate, filtered_data, stats = asyncio.run(denoise_live(os.path.join(HERE, 'buzzjc.wav')))
+    summary = stats.summary()
+    print(f"Frames: {summary['frames']} ({summary['delivered']} delivered, {summary['dropped']} dropped), "
+          f"underruns: {summary['underruns']}")
+    print(f"Latency per frame: mean {summary['latency_mean'] * 1e3:.3f} ms, "
+          f"p95 {summary['latency_p95'] * 1e3:.3f} ms, max {summary['latency_max'] * 1e3:.3f} ms "
+          f"(+ {summary['fixed_delay'] * 1e3:.2f} ms frame and filter delay, end to end max "
+          f"{summary['end_to_end_max'] * 1e3:.2f} ms, budget {summary['latency_budget'] * 1e3:.0f} ms)")
+
+    if "--out" in sys.argv:
+        import scipy.io.wavfile as wavfile
+
+        out_path = sys.argv[sys.argv.index("--out") + 1]
+        peak = np.max(np.abs(filtered_data)) or 1.0
+        wavfile.write(out_path, sample_rate, np.int16(filtered_data / peak * 32767))
+        print(f"Filtered audio saved as '{out_path}'")
+
+
+if __name__ == "__main__":
+    main()
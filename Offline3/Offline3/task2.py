@@ -1,105 +1,210 @@
+import os
+import sys
+import warnings
+
 import numpy as np
 import scipy.io.wavfile as wavfile
 import matplotlib.pyplot as plt
 
-import os
-print(os.getcwd())
-
-# Step 1: Load the audio file
-sample_rate, data = wavfile.read('buzzjc.wav')
-data = data / np.max(np.abs(data))  # Normalize to -1 to 1
-
-# If stereo, convert to mono by averaging channels
-if len(data.shape) > 1:
-    data = data.mean(axis=1)
-
-# Step 1.1: Plot the original audio signal in the time domain
-plt.figure(figsize=(12, 4))
-time = np.linspace(0, len(data) / sample_rate, num=len(data))
-plt.plot(time, data)
-plt.title("Original Audio Signal (Time Domain)")
-plt.xlabel("Time (s)")
-plt.ylabel("Amplitude")
-plt.grid()
-plt.show()
-
-# Step 2: Down-sample the audio for faster processing
-interval_step = 1  # Adjust this for sampling every 'interval_step' data points  
-data_sampled = data[::interval_step]
-max_time = len(data_sampled) / (sample_rate / interval_step)
-sampled_times = np.linspace(0, max_time, num=len(data_sampled))
-
-# Define frequencies for Fourier Transform
-max_freq = sample_rate / (2 * interval_step)
-num_freqs = len(data_sampled)
-frequencies = np.linspace(-max_freq, max_freq, num=num_freqs)
-
-# Step 3: Fourier Transform using trapezoidal integration
-def fourier_transform(signal, frequencies, sampled_times):
-    real_part = np.zeros(len(frequencies))
-    imag_part = np.zeros(len(frequencies))
-    for i, freq in enumerate(frequencies):
-        exponential = np.exp(-2j * np.pi * freq * sampled_times)
-        real_part[i] = np.trapz(signal * np.real(exponential), sampled_times)
-        imag_part[i] = np.trapz(signal * np.imag(exponential), sampled_times)
-    return real_part, imag_part
-
-# Apply Fourier Transform to the audio
-ft_data = fourier_transform(data_sampled, frequencies, sampled_times)
-
-# Step 3.1: Visualize the frequency spectrum
-plt.figure(figsize=(12, 6))
-plt.plot(frequencies, np.sqrt(ft_data[0]**2 + ft_data[1]**2))
-plt.title("Frequency Spectrum of the Audio Signal")
-plt.xlabel("Frequency (Hz)")
-plt.ylabel("Magnitude")
-plt.grid()
-plt.show()
-
-# Step 4: Identify and Keep High Frequencies
-filtered_ft_data = np.zeros((2, num_freqs))
-filtered_ft_data[0] = ft_data[0].copy()
-filtered_ft_data[1] = ft_data[1].copy()
-
-# Filter out low frequencies (e.g., keep only frequencies >= threshold_frequency)
-threshold_frequency = 1000  # Set the cutoff frequency for the high-pass filter
-high_pass_filter = np.abs(frequencies) >= threshold_frequency
-filtered_ft_data[0] *= high_pass_filter  # Apply filter to the real part
-filtered_ft_data[1] *= high_pass_filter  # Apply filter to the imaginary part
-
-
-# Step 4.1: Visualize the filtered frequency spectrum
-plt.figure(figsize=(12, 6))
-plt.plot(frequencies, np.sqrt(filtered_ft_data[0]**2 + filtered_ft_data[1]**2))
-plt.title("Filtered Frequency Spectrum (High-Frequency Noise Removed)")
-plt.xlabel("Frequency (Hz)")
-plt.ylabel("Magnitude")
-plt.grid()
-plt.show()
-
-# Step 5: Inverse Fourier Transform using trapezoidal integration
-def inverse_fourier_transform(ft_signal, frequencies, sampled_times):
-    reconstructed_signal = np.zeros(len(sampled_times))
-    ft_combined = ft_signal[0] + 1j * ft_signal[1]
-    for t_idx, t in enumerate(sampled_times):
-        exponential = np.exp(2j * np.pi * frequencies * t)
-        reconstructed_signal[t_idx] = np.trapz(ft_combined * exponential, frequencies).real
-    return reconstructed_signal
-
-# Reconstruct the denoised audio signal
-filtered_data = inverse_fourier_transform(filtered_ft_data, frequencies, sampled_times)
-
-# Step 5.1: Plot the reconstructed signal
-plt.figure(figsize=(12, 4))
-plt.plot(sampled_times, filtered_data)
-plt.title("Reconstructed (Denoised) Audio Signal (Time Domain)")
-plt.xlabel("Time (s)")
-plt.ylabel("Amplitude")
-plt.grid()
-plt.show()
-
-# Step 6: Normalize and Save the Denoised Audio
-filtered_data = np.int16(filtered_data / np.max(np.abs(filtered_data)) * 32767)  # Convert to int16
-wavfile.write('denoised_audio.wav', sample_rate, filtered_data)
-
-print("Denoised audio saved as 'denoised_audio.wav'")
+from sigsys.fourier_transform import fourier_transform, inverse_fourier_transform
+from sigsys.instrumentation import timer
+from sigsys.metrics import reconstruction_metrics
+from sigsys.pipeline import Pipeline, file_fingerprint
+from sigsys.resample import resample
+from sigsys.storage import Store
+from sigsys.wav_io import load_normalized_mono
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+# Stages of the denoising pipeline. Each one gets the outputs of the stages it depends on and
+# its own parameters, and must not modify its inputs (they are cached).
+
+def load_audio(path, fingerprint):
+    # The file is memory-mapped; normalization to -1 to 1 and the stereo to mono
+    # average are done block by block into a float32 array
+    return load_normalized_mono(path)
+
+
+def downsample(audio, interval_step):
+    sample_rate, data = audio
+    # Low-pass filtered before decimating (polyphase), so content above the new Nyquist
+    # frequency is removed instead of aliasing into the band like data[::interval_step]
+    data_sampled = resample(data, 1, interval_step)
+    max_time = len(data_sampled) / (sample_rate / interval_step)
+    sampled_times = np.linspace(0, max_time, num=len(data_sampled))
+
+    # Define frequencies for Fourier Transform
+    max_freq = sample_rate / (2 * interval_step)
+    num_freqs = len(data_sampled)
+    frequencies = np.linspace(-max_freq, max_freq, num=num_freqs)
+    return data_sampled, sampled_times, frequencies
+
+
+def forward_transform(sampled, precision, workers=1):
+    data_sampled, sampled_times, frequencies = sampled
+    return fourier_transform(data_sampled, frequencies, sampled_times, dtype=np.dtype(precision), workers=workers)
+
+
+# Cutoffs above this fraction of the downsampled Nyquist frequency fall in the transition
+# band of the resampler's anti-aliasing filter
+NYQUIST_WARNING_FRACTION = 0.8
+
+
+def high_pass(spectrum, threshold_frequency):
+    # The spectrum only reaches the Nyquist frequency of the downsampled audio (and the
+    # anti-aliasing filter has already removed what is above it), so a cutoff at or
+    # above that would keep nothing
+    nyquist = np.max(np.abs(spectrum.frequencies))
+    if threshold_frequency >= nyquist:
+        raise ValueError(
+            f"threshold_frequency {threshold_frequency:g} Hz is at or above the Nyquist frequency "
+            f"{nyquist:g} Hz of the downsampled audio; use a smaller interval_step (--step)"
+        )
+    if NYQUIST_WARNING_FRACTION * nyquist <= threshold_frequency:
+        warnings.warn(
+            f"threshold_frequency {threshold_frequency:g} Hz is close to the Nyquist frequency {nyquist:g} Hz "
+            "of the downsampled audio, where the anti-aliasing filter attenuates the band being kept",
+            RuntimeWarning,
+        )
+    # Copy first: the transform is cached and shared by every cutoff
+    return spectrum.copy().high_pass(threshold_frequency)
+
+
+def inverse_transform(filtered_spectrum, sampled, precision, workers=1):
+    _, sampled_times, frequencies = sampled
+    return inverse_fourier_transform(filtered_spectrum, frequencies, sampled_times, dtype=np.dtype(precision),
+                                     workers=workers)
+
+
+def build_pipeline(path, interval_step=1, threshold_frequency=1000, precision="float64", cache_dir=None, workers=1):
+    """
+    load -> downsample -> forward transform -> high-pass -> inverse transform.
+
+    Changing threshold_frequency (pipeline.set("high_pass", threshold_frequency=...)) only
+    reruns the mask and the inverse transform. With cache_dir the forward transform is also
+    kept on disk, keyed by the file and the parameters, and reused by later runs. workers > 1
+    (None: one per CPU) runs the transforms tiled on a thread pool; it does not change the
+    result, so it is not part of the cache key.
+    """
+    pipeline = Pipeline(store=Store(cache_dir) if cache_dir else None)
+    pipeline.add("load", load_audio, path=path, fingerprint=file_fingerprint(path))
+    pipeline.add("downsample", downsample, ["load"], interval_step=interval_step)
+    pipeline.add("forward", forward_transform, ["downsample"], persist=True, precision=precision,
+                 runtime={"workers": workers})
+    pipeline.add("high_pass", high_pass, ["forward"], threshold_frequency=threshold_frequency)
+    pipeline.add("inverse", inverse_transform, ["high_pass", "downsample"], precision=precision,
+                 runtime={"workers": workers})
+    return pipeline
+
+
+def sweep(pipeline, cutoffs):
+    """
+    Metrics of the denoised signal for every cutoff frequency.
+    """
+    data_sampled = pipeline.run("downsample")[0]
+    for cutoff in cutoffs:
+        pipeline.set("high_pass", threshold_frequency=cutoff)
+        filtered_data = pipeline.run("inverse")
+        report = reconstruction_metrics(data_sampled, filtered_data)
+        print(f"Cutoff {cutoff:>8g} Hz  RMSE: {report['rmse']:.6f}  SNR: {report['snr_db']:.2f} dB  "
+              f"Energy kept: {report['energy_ratio']:.4f}  (computed: {', '.join(pipeline.computed)})")
+
+
+def main():
+    # Precision of the transforms: "float32" halves memory, see sigsys.fourier_transform
+    # --cache <dir> keeps the forward transform between runs, --sweep <f1,f2,...> only
+    # prints the metrics for several cutoff frequencies, --step <n> analyses the audio at
+    # 1/n of its sample rate (the transforms then cost about 1/n^2), --workers <n> runs the
+    # transforms on n threads (0: one per CPU)
+    cache_dir = sys.argv[sys.argv.index("--cache") + 1] if "--cache" in sys.argv else None
+    interval_step = int(sys.argv[sys.argv.index("--step") + 1]) if "--step" in sys.argv else 1
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else 1
+    pipeline = build_pipeline(os.path.join(HERE, 'buzzjc.wav'), interval_step=interval_step, threshold_frequency=1000,
+                              precision="float64", cache_dir=cache_dir, workers=workers or None)
+    if "--sweep" in sys.argv:
+        cutoffs = [float(value) for value in sys.argv[sys.argv.index("--sweep") + 1].split(",")]
+        sweep(pipeline, cutoffs)
+        return
+
+    # Step 1: Load the audio file
+    sample_rate, data = pipeline.run("load")
+
+    # Step 1.1: Plot the original audio signal in the time domain
+    plt.figure(figsize=(12, 4))
+    time = np.linspace(0, len(data) / sample_rate, num=len(data))
+    plt.plot(time, data)
+    plt.title("Original Audio Signal (Time Domain)")
+    plt.xlabel("Time (s)")
+    plt.ylabel("Amplitude")
+    plt.grid()
+    with timer("matplotlib.render"):
+        plt.show()
+
+    # Step 2: Down-sample the audio for faster processing
+    # interval_step: sampling every 'interval_step' data points (set in build_pipeline)
+    data_sampled, sampled_times, frequencies = pipeline.run("downsample")
+
+    # Step 3: Fourier Transform using trapezoidal integration (sigsys.fourier_transform)
+    # Apply Fourier Transform to the audio
+    ft_data = pipeline.run("forward")
+
+    # Step 3.1: Visualize the frequency spectrum
+    plt.figure(figsize=(12, 6))
+    plt.plot(frequencies, ft_data.magnitude())
+    plt.title("Frequency Spectrum of the Audio Signal")
+    plt.xlabel("Frequency (Hz)")
+    plt.ylabel("Magnitude")
+    plt.grid()
+    with timer("matplotlib.render"):
+        plt.show()
+
+    # Step 4: Identify and Keep High Frequencies
+    # Filter out low frequencies (keep only frequencies >= threshold_frequency, the
+    # cutoff of the high-pass filter set in build_pipeline)
+    filtered_ft_data = pipeline.run("high_pass")
+
+
+    # Step 4.1: Visualize the filtered frequency spectrum
+    plt.figure(figsize=(12, 6))
+    plt.plot(frequencies, filtered_ft_data.magnitude())
+    plt.title("Filtered Frequency Spectrum (High-Frequency Noise Removed)")
+    plt.xlabel("Frequency (Hz)")
+    plt.ylabel("Magnitude")
+    plt.grid()
+    with timer("matplotlib.render"):
+        plt.show()
+
+    # Step 5: Inverse Fourier Transform using trapezoidal integration (sigsys.inverse_fourier_transform)
+    # Reconstruct the denoised audio signal
+    filtered_data = pipeline.run("inverse")
+
+    # How much of the original signal survived the filter
+    report = reconstruction_metrics(data_sampled, filtered_data)
+    print(f"RMSE: {report['rmse']:.6f}, Max error: {report['max_error']:.6f}, "
+          f"SNR: {report['snr_db']:.2f} dB, Energy kept: {report['energy_ratio']:.4f}")
+
+    # Step 5.1: Plot the reconstructed signal
+    plt.figure(figsize=(12, 4))
+    plt.plot(sampled_times, filtered_data)
+    plt.title("Reconstructed (Denoised) Audio Signal (Time Domain)")
+    plt.xlabel("Time (s)")
+    plt.ylabel("Amplitude")
+    plt.grid()
+    with timer("matplotlib.render"):
+        plt.show()
+
+    # Step 6: Normalize and Save the Denoised Audio
+    # Back at the original sample rate, so the file plays at the right speed whatever
+    # interval_step the analysis ran at
+    interval_step = pipeline.nodes["downsample"].params["interval_step"]
+    if interval_step != 1:
+        filtered_data = resample(filtered_data, interval_step, 1)[:len(data)]
+    filtered_data = np.int16(filtered_data / np.max(np.abs(filtered_data)) * 32767)  # Convert to int16
+    wavfile.write(os.path.join(HERE, 'denoised_audio.wav'), sample_rate, filtered_data)
+
+    print("Denoised audio saved as 'denoised_audio.wav'")
+
+
+if __name__ == "__main__":
+    main()
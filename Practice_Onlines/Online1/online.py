@@ -1,25 +1,30 @@
-import import_ipynb
-import Discrete
+from sigsys.discrete import DiscreteSignal, LTI_Discrete
 
 
-degree1 = int(input("Degree of the first polynomial: "))
-input_signal = Discrete.DiscreteSignal(10)
-coeff1 = []
-for i in range(degree1+1):
-    # print("Enter the coefficient of x^", i)
-    # coeff1.append(float(input()))
-    input_signal.set_value_at_time(i, float(input("Enter the coefficient of x^"+str(-i+degree1)+": ")))
+def main():
+    degree1 = int(input("Degree of the first polynomial: "))
+    input_signal = DiscreteSignal(10)
+    coeff1 = []
+    for i in range(degree1+1):
+        # print("Enter the coefficient of x^", i)
+        # coeff1.append(float(input()))
+        input_signal.set_value_at_time(i, float(input("Enter the coefficient of x^"+str(-i+degree1)+": ")))
 
-input_signal.shift_signal(2)
-input_signal.plot("input signal")
+    input_signal.shift_signal(2)
+    input_signal.plot("input signal")
 
-degree2 = input("Degree of the second polynomial: ")
-impulse_response = Discrete.DiscreteSignal(10)
-# input("Coefficients : ")
-# coeff2 = []
-for i in range(degree2+1):
-    # coeff2.append(float(input()))
-    impulse_response.set_value_at_time(i, float(input()))
-impulse_response.plot("impulse response")
+    degree2 = int(input("Degree of the second polynomial: "))
+    impulse_response = DiscreteSignal(10)
+    # input("Coefficients : ")
+    # coeff2 = []
+    for i in range(degree2+1):
+        # coeff2.append(float(input()))
+        impulse_response.set_value_at_time(i, float(input()))
+    impulse_response.plot("impulse response")
 
+    # The same kernel in the frequency domain (a moving average, for example, is a low-pass)
+    LTI_Discrete(impulse_response).frequency_response_plot("impulse response frequency response")
 
+
+if __name__ == "__main__":
+    main()
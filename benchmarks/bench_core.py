@@ -0,0 +1,152 @@
+"""
+Benchmarks for the signal / LTI / transform hot paths.
+
+Every case runs on synthetic signals, so no data files or network are needed:
+
+    python benchmarks/bench_core.py                 # all cases, all sizes
+    python benchmarks/bench_core.py --quick         # smallest size of each case only
+    python benchmarks/bench_core.py --only fourier  # cases whose name contains "fourier"
+    python benchmarks/bench_core.py --json out.json # also write the results as JSON
+
+For each case and size the best and median wall time over --repeat runs and the peak
+memory allocated by Python/NumPy during one run (tracemalloc) are reported.
+"""
+import argparse
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+
+
+CASES = []
+
+
+def case(name, params):
+    """
+    Register a benchmark. The decorated function takes one parameter value and returns a
+    zero-argument callable: everything before the return is setup and is not timed.
+    """
+    def register(setup):
+        CASES.append((name, params, setup))
+        return setup
+    return register
+
+
+@case("LTI_Discrete.output", params=[10, 50, 200])
+def lti_discrete_output(INF):
+    from sigsys.discrete import DiscreteSignal, LTI_Discrete
+
+    rng = np.random.default_rng(0)
+    impulse_response = DiscreteSignal(INF)
+    impulse_response.values[INF:INF + 5] = 1 / 5
+    input_signal = DiscreteSignal(INF)
+    input_signal.values[:] = rng.standard_normal(2 * INF + 1)
+    lti_system = LTI_Discrete(impulse_response)
+    return lambda: lti_system.output(input_signal)
+
+
+@case("LTIContinuous.output_approx", params=[0.5, 0.1, 0.05])
+def lti_continuous_output_approx(delta):
+    from sigsys.continuous import ContinuousSignal, LTIContinuous
+
+    INF = 3
+    lti_system = LTIContinuous(ContinuousSignal(lambda t: 1 * (t >= 0), INF))
+    input_signal = ContinuousSignal(lambda t: np.exp(-t) * (t >= 0), INF)
+    t_values = np.linspace(-INF, INF, 1000)
+
+    def run():
+        _, _, output_signal = lti_system.output_approx(input_signal, delta)
+        return output_signal.func(t_values)
+    return run
+
+
+@case("fourier_transform+inverse", params=[(500, 250), (1000, 500), (2000, 1000)])
+def fourier_round_trip(sizes):
+    from sigsys.fourier_transform import fourier_transform, inverse_fourier_transform
+
+    num_times, num_freqs = sizes
+    sampled_times = np.linspace(-5, 5, num_times)
+    frequencies = np.linspace(-2, 2, num_freqs)
+    signal = np.where(np.abs(sampled_times) <= 2, 1.0, 0.0)  # rect, as in task1
+
+    def run():
+        spectrum = fourier_transform(signal, frequencies, sampled_times)
+        return inverse_fourier_transform(spectrum, frequencies, sampled_times)
+    return run
+
+
+@case("fourier_transform+inverse tiled", params=[(500, 250), (1000, 500), (2000, 1000)])
+def fourier_round_trip_tiled(sizes):
+    from sigsys.fourier_transform import fourier_transform, inverse_fourier_transform
+
+    num_times, num_freqs = sizes
+    sampled_times = np.linspace(-5, 5, num_times)
+    frequencies = np.linspace(-2, 2, num_freqs)
+    signal = np.where(np.abs(sampled_times) <= 2, 1.0, 0.0)
+
+    def run():
+        spectrum = fourier_transform(signal, frequencies, sampled_times, workers=None)
+        return inverse_fourier_transform(spectrum, frequencies, sampled_times, workers=None)
+    return run
+
+
+@case("FourierSeries.approximate", params=[5, 20, 80])
+def fourier_series_approximate(terms):
+    from sigsys.fourier_series import FourierSeries, target_function
+
+    series = FourierSeries(lambda x: target_function(x, "square"), np.pi, terms)
+    x = np.linspace(-np.pi, np.pi, 1000)
+    return lambda: series.approximate(x)
+
+
+def measure(run, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"best": min(times), "median": statistics.median(times), "peak_bytes": peak}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per size (default 5)")
+    parser.add_argument("--quick", action="store_true", help="only run the smallest size of each case")
+    parser.add_argument("--only", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'Case':<34}{'Size':>14}{'Best (s)':>12}{'Median (s)':>12}{'Peak (MiB)':>12}")
+    for name, params, setup in CASES:
+        if args.only.lower() not in name.lower():
+            continue
+        for param in params[:1] if args.quick else params:
+            stats = measure(setup(param), args.repeat)
+            results.append({"case": name, "param": param, **stats})
+            print(f"{name:<34}{str(param):>14}{stats['best']:>12.5f}{stats['median']:>12.5f}"
+                  f"{stats['peak_bytes'] / 2 ** 20:>12.2f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "repeat": args.repeat,
+                "results": results,
+            }, f, indent=2)
+        print(f"Results saved as {args.json}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
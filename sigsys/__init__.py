@@ -0,0 +1,56 @@
+"""
+Signals and linear systems: discrete/continuous signals, LTI systems, Fourier transforms
+and Fourier series.
+
+Importing the package only loads NumPy. Matplotlib is imported the first time something is
+plotted, and SciPy the first time a feature that needs it is used (WAV input, cubic
+interpolation, LTI_IIR filtering). Heavier helpers stay in their own modules: sigsys.batch
+(process pool sweeps), sigsys.wav_io, sigsys.storage (saving results, content-hash keyed
+stores), sigsys.pipeline (cached stage graphs) and sigsys.streaming (asyncio frame-by-frame
+filtering).
+"""
+from .discrete import DiscreteSignal, LTI_Discrete, LTI_IIR
+from .continuous import ContinuousSignal, LTIContinuous, adaptive_convolution
+from .analytic import AnalyticSignal
+from .sampled import SampledSignal
+from .impulse_basis import PulseBasis
+from .spectrum import Spectrum
+from .fourier_transform import fourier_transform, inverse_fourier_transform
+from .fourier_series import (
+    FourierSeries, FourierCoefficients, target_function, fft_coefficients, series_coefficients, partial_sums, fourier_series_batch,
+    synthesize, sigma_weights,
+)
+from .fir import FIRStream, lowpass_taps, highpass_taps
+from .resample import Resampler, resample
+from .metrics import reconstruction_metrics, evaluate_transform
+
+__all__ = [
+    "DiscreteSignal",
+    "LTI_Discrete",
+    "LTI_IIR",
+    "ContinuousSignal",
+    "LTIContinuous",
+    "adaptive_convolution",
+    "AnalyticSignal",
+    "SampledSignal",
+    "PulseBasis",
+    "Spectrum",
+    "fourier_transform",
+    "inverse_fourier_transform",
+    "FourierSeries",
+    "FourierCoefficients",
+    "target_function",
+    "fft_coefficients",
+    "series_coefficients",
+    "partial_sums",
+    "fourier_series_batch",
+    "synthesize",
+    "sigma_weights",
+    "FIRStream",
+    "lowpass_taps",
+    "highpass_taps",
+    "Resampler",
+    "resample",
+    "reconstruction_metrics",
+    "evaluate_transform",
+]
@@ -0,0 +1,150 @@
+import numpy as np
+from math import comb, factorial
+
+from .continuous import ContinuousSignal
+
+
+class ExpPolyTerm:
+    __slots__ = ("coef", "power", "rate", "delay")
+
+    def __init__(self, coef, power, rate, delay):
+        """
+        One term coef * (t - delay)^power * e^(rate * (t - delay)) * u(t - delay).
+
+        Unit steps, rects, exponentials and first/second-order sections are all sums of
+        these, and the convolution of two terms has a closed form (see convolve_terms).
+        coef and rate may be complex (e.g. a damped sine); only the real part of the
+        full sum is ever evaluated.
+        """
+        self.coef = coef
+        self.power = int(power)
+        self.rate = rate
+        self.delay = float(delay)
+
+    def evaluate(self, t):
+        tau = np.asarray(t, dtype=float) - self.delay
+        active = tau >= 0
+        tau = np.where(active, tau, 0.0)  # keep exp() from overflowing where u(t - delay) = 0
+        return np.where(active, self.coef * tau ** self.power * np.exp(self.rate * tau), 0)
+
+
+def _pole_expansion(m, n, a, b):
+    """
+    Partial fractions of 1 / ((s - a)^m (s - b)^n) for a != b.
+
+    Returns:
+    - A list of (residue, pole, order) so that the expression equals
+      sum(residue / (s - pole)^order).
+    """
+    terms = []
+    for j in range(1, m + 1):
+        terms.append(((-1) ** (m - j) * comb(n + m - j - 1, m - j) / (a - b) ** (n + m - j), a, j))
+    for j in range(1, n + 1):
+        terms.append(((-1) ** (n - j) * comb(n + m - j - 1, n - j) / (b - a) ** (n + m - j), b, j))
+    return terms
+
+
+def convolve_terms(first, second, tol=1e-12):
+    """
+    Exact convolution of two ExpPolyTerms, done in the Laplace domain:
+    t^k e^(at) u(t) <-> k! / (s - a)^(k+1), and the delays add.
+    """
+    delay = first.delay + second.delay
+    coef = first.coef * second.coef
+    k1, k2 = first.power, second.power
+    a, b = first.rate, second.rate
+
+    if abs(a - b) <= tol * (1 + abs(a) + abs(b)):
+        # Same pole: k1! k2! / (s - a)^(k1 + k2 + 2)
+        power = k1 + k2 + 1
+        scale = factorial(k1) * factorial(k2) / factorial(power)
+        return [ExpPolyTerm(coef * scale, power, a, delay)]
+
+    scale = coef * factorial(k1) * factorial(k2)
+    return [
+        ExpPolyTerm(scale * residue / factorial(order - 1), order - 1, pole, delay)
+        for residue, pole, order in _pole_expansion(k1 + 1, k2 + 1, a, b)
+    ]
+
+
+class AnalyticSignal(ContinuousSignal):
+    __slots__ = ("terms",)
+
+    def __init__(self, terms, INF):
+        """
+        A ContinuousSignal with a closed form: a sum of ExpPolyTerms.
+
+        It is still a ContinuousSignal (func works everywhere one is expected), but
+        convolving two AnalyticSignals gives the exact result instead of a Riemann sum.
+        """
+        self.terms = list(terms)
+        super().__init__(self._evaluate, INF)
+
+    def _evaluate(self, t):
+        result = np.zeros(np.shape(t))
+        for term in self.terms:
+            result = result + term.evaluate(t)
+        return np.real(result)
+
+    def shift(self, shift):
+        return AnalyticSignal(
+            [ExpPolyTerm(term.coef, term.power, term.rate, term.delay + shift) for term in self.terms],
+            self.INF,
+        )
+
+    def add(self, other):
+        if not isinstance(other, AnalyticSignal):
+            return super().add(other)
+        return AnalyticSignal(self.terms + other.terms, self.INF)
+
+    def multiply_const_factor(self, scaler):
+        return AnalyticSignal(
+            [ExpPolyTerm(term.coef * scaler, term.power, term.rate, term.delay) for term in self.terms],
+            self.INF,
+        )
+
+    def convolve(self, other):
+        """
+        Exact convolution with another AnalyticSignal.
+        """
+        terms = []
+        for first in self.terms:
+            for second in other.terms:
+                terms.extend(convolve_terms(first, second))
+        return AnalyticSignal(terms, self.INF)
+
+
+# Library of primitives
+
+def unit_step(INF, delay=0):
+    # u(t - delay)
+    return AnalyticSignal([ExpPolyTerm(1.0, 0, 0.0, delay)], INF)
+
+
+def rect(INF, start, end, height=1.0):
+    # height between start and end, 0 elsewhere
+    return AnalyticSignal([ExpPolyTerm(height, 0, 0.0, start), ExpPolyTerm(-height, 0, 0.0, end)], INF)
+
+
+def exponential(INF, rate, delay=0, amplitude=1.0):
+    # amplitude * e^(rate * (t - delay)) * u(t - delay), e.g. rate=-1 for e^(-t) u(t)
+    return AnalyticSignal([ExpPolyTerm(amplitude, 0, rate, delay)], INF)
+
+
+def first_order(INF, tau):
+    # Impulse response of 1 / (tau s + 1): (1 / tau) e^(-t / tau) u(t)
+    return exponential(INF, -1.0 / tau, amplitude=1.0 / tau)
+
+
+def second_order(INF, wn, zeta):
+    """
+    Impulse response of wn^2 / (s^2 + 2 zeta wn s + wn^2), for any damping ratio zeta.
+    """
+    if np.isclose(zeta, 1.0):
+        # Critically damped: wn^2 t e^(-wn t) u(t)
+        return AnalyticSignal([ExpPolyTerm(wn ** 2, 1, -wn, 0)], INF)
+    root = wn * np.sqrt(complex(zeta ** 2 - 1))
+    p1, p2 = -zeta * wn + root, -zeta * wn - root
+    scale = wn ** 2 / (p1 - p2)
+    return AnalyticSignal([ExpPolyTerm(scale, 0, p1, 0), ExpPolyTerm(-scale, 0, p2, 0)], INF)
+
@@ -0,0 +1,133 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .fourier_transform import fourier_transform, inverse_fourier_transform
+from .metrics import evaluate_transform
+
+
+def _to_shared(array):
+    """
+    Copy an array into a new shared memory block.
+
+    Returns:
+    - shm: The SharedMemory block (the caller is responsible for unlinking it).
+    - spec: (name, shape, dtype) so a worker can attach to the block.
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _attach(spec):
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _run_job(job):
+    """
+    Worker: forward + inverse transform for one (signal, frequency grid) pair.
+    Inputs are read straight out of shared memory, only the results are pickled back.
+    """
+    signal_idx, grid_idx, grid_len, times_spec, signals_spec, grids_spec = job
+    handles = []
+    try:
+        shm, times = _attach(times_spec)
+        handles.append(shm)
+        shm, signals = _attach(signals_spec)
+        handles.append(shm)
+        shm, grids = _attach(grids_spec)
+        handles.append(shm)
+
+        y_values = signals[signal_idx]
+        # Copied because the returned Spectrum keeps a reference to its frequency axis,
+        # which must outlive the shared memory mapping
+        freq_range = grids[grid_idx, :grid_len].copy()
+        ft_signal, reconstructed_signal, report = evaluate_transform(
+            y_values, freq_range, times, fourier_transform, inverse_fourier_transform
+        )
+        return {
+            "signal_idx": signal_idx,
+            "grid_idx": grid_idx,
+            "spectrum": ft_signal,
+            "reconstructed": reconstructed_signal,
+            "metrics": report,
+        }
+    finally:
+        for shm in handles:
+            shm.close()
+
+
+def run_batch(functions, frequencies_list, sampled_times, max_workers=None):
+    """
+    Run every (signal, frequency grid) combination of a transform sweep on a process pool.
+
+    The sampled signals, the time axis and the frequency grids are placed in shared
+    memory once; each job only carries indices into them.
+
+    Parameters:
+    - functions: dict of name -> signal generator.
+    - frequencies_list: list of frequency grids.
+    - sampled_times: time axis the signals are sampled on.
+    - max_workers: Size of the process pool (None lets the executor decide).
+
+    Returns:
+    - results: A list of rows (dicts), one per combination, in (signal, grid) order. Each row
+      carries the spectrum, the reconstruction and the metrics.evaluate_transform report.
+    """
+    names = list(functions)
+    sampled_times = np.asarray(sampled_times, dtype=float)
+    signals = np.stack([np.asarray(functions[name](sampled_times), dtype=float) for name in names])
+
+    # Grids can have different lengths, so pad them into one rectangular block
+    grid_lengths = [len(grid) for grid in frequencies_list]
+    grids = np.zeros((len(frequencies_list), max(grid_lengths)))
+    for i, grid in enumerate(frequencies_list):
+        grids[i, :grid_lengths[i]] = grid
+
+    blocks = []
+    try:
+        specs = []
+        for array in (sampled_times, signals, grids):
+            shm, spec = _to_shared(array)
+            blocks.append(shm)
+            specs.append(spec)
+
+        jobs = [
+            (s, g, grid_lengths[g], *specs)
+            for s in range(len(names))
+            for g in range(len(frequencies_list))
+        ]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            outputs = list(executor.map(_run_job, jobs))
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+    results = []
+    for out in outputs:
+        freq_range = np.asarray(frequencies_list[out["grid_idx"]])
+        results.append({
+            "function": names[out["signal_idx"]],
+            "freq_range": (float(freq_range[0]), float(freq_range[-1])),
+            "frequencies": freq_range,
+            "original": signals[out["signal_idx"]],
+            "spectrum": out["spectrum"],
+            "reconstructed": out["reconstructed"],
+            **out["metrics"],
+        })
+    return results
+
+
+def print_results_table(results):
+    print(f"{'Function':<24}{'Freq Range':>18}{'Max Error':>12}{'RMSE':>12}{'SNR (dB)':>10}{'Energy':>10}{'Time (s)':>10}")
+    for row in results:
+        low, high = row["freq_range"]
+        elapsed = row["forward_time"] + row["inverse_time"]
+        print(
+            f"{row['function']:<24}{f'{low:g} to {high:g}':>18}{row['max_error']:>12.6f}{row['rmse']:>12.6f}"
+            f"{row['snr_db']:>10.2f}{row['energy_ratio']:>10.4f}{elapsed:>10.4f}"
+        )
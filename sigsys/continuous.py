@@ -0,0 +1,494 @@
+import numpy as np
+import os 
+from collections import OrderedDict
+
+from .impulse_basis import PulseBasis
+from .instrumentation import instrument, timer
+
+class ContinuousSignal:
+    # LTIContinuous creates one of these per pulse; keep them free of a per-instance __dict__
+    __slots__ = ("INF", "func", "cache_size", "_cache")
+
+    def __init__(self, func, INF, cache_size=0):
+        self.INF = INF
+        self.func = func
+        # Opt-in LRU cache of func evaluated on whole time grids, see evaluate(). The
+        # OrderedDict is only created once something is cached.
+        self.cache_size = cache_size
+        self._cache = None
+
+    def enable_cache(self, cache_size=8):
+        self.cache_size = cache_size
+        return self
+
+    def clear_cache(self):
+        self._cache = None
+
+    @instrument("ContinuousSignal.evaluate", samples=lambda self, t_values: np.size(t_values))
+    def evaluate(self, t_values):
+        """
+        func(t_values), memoized per time grid when the cache is enabled (cache_size > 0).
+
+        The cache is keyed by a hash of the grid and keeps the last cache_size grids. Only
+        1-D grids are cached; scalars go straight to func. Cached arrays are read-only.
+        Enable the cache before deriving signals (shift, add, ...) so they read through it.
+        """
+        if not self.cache_size or np.ndim(t_values) != 1 or len(t_values) < 2:
+            return self.func(t_values)
+        t_values = np.asarray(t_values, dtype=float)
+        key = (t_values.size, hash(t_values.tobytes()))
+        if self._cache is None:
+            self._cache = OrderedDict()
+        entry = self._cache.get(key)
+        if entry is not None and np.array_equal(entry[0], t_values):
+            self._cache.move_to_end(key)
+            return entry[1]
+        values = np.zeros(t_values.shape) + self.func(t_values)
+        values.setflags(write=False)
+        self._cache[key] = (t_values.copy(), values)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return values
+
+    def _evaluate_shifted(self, t_values, shift):
+        # func(t_values - shift). If a cached grid lines up with the shifted grid (same step,
+        # offset by a whole number of steps) the overlapping samples are copied from it and
+        # only the part outside the cached grid is evaluated.
+        if not self._cache or np.ndim(t_values) != 1 or len(t_values) < 2:
+            return self.evaluate(np.asarray(t_values) - shift)
+        source = np.asarray(t_values, dtype=float) - shift
+        step = source[1] - source[0]
+        if step > 0 and np.allclose(np.diff(source), step, rtol=1e-9, atol=0):
+            for grid, values in reversed(self._cache.values()):
+                if not np.isclose(grid[1] - grid[0], step, rtol=1e-9, atol=0):
+                    continue
+                offset = (source[0] - grid[0]) / step
+                k = int(round(offset))
+                if abs(offset - k) > 1e-6:
+                    continue
+                lo, hi = max(0, -k), min(len(source), len(grid) - k)
+                if lo >= hi:
+                    continue
+                result = np.empty(source.shape)
+                result[lo:hi] = values[lo + k:hi + k]
+                outside = np.ones(source.shape, dtype=bool)
+                outside[lo:hi] = False
+                if outside.any():
+                    result[outside] = self.func(source[outside])
+                return result
+        return self.evaluate(source)
+
+    def _source(self):
+        # What derived signals call: the cached evaluate() if this signal caches, plain func
+        # otherwise (so long add/shift chains keep one stack frame per level)
+        return self.evaluate if self.cache_size else self.func
+
+    def shift(self, shift):
+        if self.cache_size:
+            shifted_func = lambda t: self._evaluate_shifted(t, shift)
+        else:
+            shifted_func = lambda t: self.func(t - shift)
+        return ContinuousSignal(shifted_func, self.INF)
+
+    def add(self, other):
+        left, right = self._source(), other._source()
+        added_func = lambda t: left(t) + right(t)
+        return ContinuousSignal(added_func, self.INF)
+
+    def multiply(self, other):
+        left, right = self._source(), other._source()
+        multiplied_func = lambda t: left(t) * right(t)
+        return ContinuousSignal(multiplied_func, self.INF)
+
+    def multiply_const_factor(self, scaler):
+        source = self._source()
+        scaled_func = lambda t: source(t) * scaler
+        return ContinuousSignal(scaled_func, self.INF)
+
+    @instrument("ContinuousSignal.plot")
+    def plot(self, title = "Continuous Signal"):
+        import matplotlib.pyplot as plt
+        save_path = "Continuous"
+        os.makedirs(save_path, exist_ok=True)
+        save_filepath = os.path.join(save_path, f"{title}.png")
+        num_points = 5000 
+        # t_range = [-self.INF, self.INF]
+        t_values = np.linspace(-self.INF, self.INF, num_points)
+        y_values = self.evaluate(t_values)
+
+        plt.figure(figsize=(10, 6))
+        plt.plot(t_values, y_values)
+        plt.title(title)
+        plt.xlabel('Time (t)')
+        plt.ylabel('Signal Value')
+        plt.grid(True)
+        with timer("matplotlib.render"):
+            plt.savefig(save_filepath, dpi=300)
+            plt.show()
+
+@instrument("adaptive_convolution", samples=lambda x_func, h_func, t_values, *args, **kwargs: np.size(t_values))
+def adaptive_convolution(x_func, h_func, t_values, lower, upper, tol=1e-6, initial_intervals=64, max_depth=30,
+                         x_breakpoints=(), h_breakpoints=()):
+    """
+    y(t) = integral of x(tau) h(t - tau) over [lower, upper], by adaptive Simpson quadrature.
+
+    Intervals are only split where the Simpson error estimate is above their share of tol,
+    so the grid gets fine around edges (e.g. a rect) and stays coarse where the integrand
+    is smooth. All pending intervals of all output points are evaluated together in one
+    vectorized call of x_func and h_func per refinement level.
+
+    Parameters:
+    - x_func, h_func: Vectorized functions of time (ContinuousSignal.func).
+    - t_values: Output times.
+    - lower, upper: Integration limits for tau.
+    - tol: Target absolute error of each output value.
+    - initial_intervals: Uniform subintervals to start from. Features of the integrand narrower
+      than one of these can be missed entirely, as with any sampling-based rule, unless
+      their edges are given as breakpoints.
+    - max_depth: Maximum number of halvings; intervals this small are accepted as they are.
+    - x_breakpoints, h_breakpoints: Times where x or h jump or kink (e.g. the edges of a
+      rect). They are added to the starting grid of every output point (as tau and as
+      t - tau), so each starting interval sees a smooth integrand and tol holds even for
+      pulses narrower than the uniform spacing.
+
+    Returns:
+    - y_values: Output at t_values (same shape as t_values).
+    - evaluations: Total number of integrand evaluations.
+    """
+    t_values = np.asarray(t_values, dtype=float)
+    t_flat = t_values.ravel()
+    result = np.zeros(t_flat.size)
+
+    def integrand(tau, owner):
+        return np.zeros(tau.shape) + x_func(tau) * h_func(t_flat[owner] - tau)
+
+    length = upper - lower
+    min_width = length / 2 ** max_depth
+    min_share = 1 / (4 * initial_intervals)
+    # Starting grid per output point: uniform edges plus the breakpoints of x (fixed in tau)
+    # and of h (at t - breakpoint), clipped to the limits; clipped duplicates give
+    # zero-width intervals, which are accepted right away
+    x_breakpoints = np.asarray(x_breakpoints, dtype=float).ravel()
+    h_breakpoints = np.asarray(h_breakpoints, dtype=float).ravel()
+    edges = np.concatenate([
+        np.broadcast_to(np.linspace(lower, upper, initial_intervals + 1), (t_flat.size, initial_intervals + 1)),
+        np.broadcast_to(x_breakpoints, (t_flat.size, x_breakpoints.size)),
+        t_flat[:, None] - h_breakpoints[None, :],
+    ], axis=1)
+    edges = np.sort(np.clip(edges, lower, upper), axis=1)
+    owner = np.repeat(np.arange(t_flat.size), edges.shape[1] - 1)
+    a = edges[:, :-1].ravel()
+    b = edges[:, 1:].ravel()
+    m = (a + b) / 2
+    fa, fm, fb = integrand(a, owner), integrand(m, owner), integrand(b, owner)
+    whole = (b - a) / 6 * (fa + 4 * fm + fb)
+    evaluations = 3 * a.size
+
+    while a.size:
+        lm, rm = (a + m) / 2, (m + b) / 2
+        flm, frm = integrand(lm, owner), integrand(rm, owner)
+        evaluations += 2 * a.size
+        left = (m - a) / 6 * (fa + 4 * flm + fm)
+        right = (b - m) / 6 * (fm + 4 * frm + fb)
+        error = left + right - whole
+
+        done = (np.abs(error) <= 15 * tol * np.maximum((b - a) / length, min_share)) | (b - a <= min_width)
+        np.add.at(result, owner[done], (left + right + error / 15)[done])
+
+        # Split every interval that is not done into its two halves
+        keep = ~done
+        owner = np.concatenate([owner[keep], owner[keep]])
+        a, m, b = np.concatenate([a[keep], m[keep]]), np.concatenate([lm[keep], rm[keep]]), np.concatenate([m[keep], b[keep]])
+        fa, fm, fb = np.concatenate([fa[keep], fm[keep]]), np.concatenate([flm[keep], frm[keep]]), np.concatenate([fm[keep], fb[keep]])
+        whole = np.concatenate([left[keep], right[keep]])
+
+    return result.reshape(t_values.shape), evaluations
+
+def _breakpoints(signal):
+    # Times where a signal may jump or kink: the term delays of an AnalyticSignal, the
+    # ends of a SampledSignal's grid (it is 0 outside); none known for a plain closure
+    if hasattr(signal, "terms"):
+        return np.array([term.delay for term in signal.terms], dtype=float)
+    if hasattr(signal, "t_grid"):
+        return np.array([signal.t_grid[0], signal.t_grid[-1]], dtype=float)
+    return np.zeros(0)
+
+
+class LTIContinuous:
+    def __init__(self, impulse_response):
+        self.impulse_response = impulse_response
+
+    @instrument("LTIContinuous.linear_combination_of_impulses")
+    def linear_combination_of_impulses(self, input_signal : "ContinuousSignal", delta : float):
+        impulses = []
+        # t_values = np.arange(-10, 10, delta)
+        t_values = np.arange(-input_signal.INF, input_signal.INF, delta)
+        coefficients = input_signal.func(t_values) * delta
+        for t in t_values:
+            # impulse = lambda tau: input_signal.func(tau) * self.impulse_response.func(t - tau)
+            impulse = ContinuousSignal(lambda tau, t=t: (1 / delta) * ((t <= tau) & (tau <= t + delta)), input_signal.INF)
+            impulses.append(impulse)
+        return impulses, coefficients
+
+    @instrument("LTIContinuous.impulse_basis")
+    def impulse_basis(self, input_signal, delta):
+        # Same decomposition as linear_combination_of_impulses, as arrays (no per-pulse signals)
+        t_values = np.arange(-input_signal.INF, input_signal.INF, delta)
+        coefficients = np.zeros(t_values.shape) + input_signal.func(t_values) * delta
+        return PulseBasis(t_values, delta, coefficients)
+
+    @instrument("LTIContinuous.output_approx")
+    def output_approx(self, input_signal, delta):
+        t_values = np.arange(-input_signal.INF, input_signal.INF, delta)
+        constituent_impulses = []
+        coeffcients = []
+        output_signal = ContinuousSignal(lambda t: 0, input_signal.INF)
+
+        for t in t_values:
+            # impulse = ContinuousSignal(lambda tau: (1 / delta) * ((t <= tau) & (tau <= t + delta)), input_signal.INF)
+            response = self.impulse_response.shift(t)
+            constituent_impulses.append(response)
+            coeffcients.append(input_signal.func(t) * delta)
+            output_signal = output_signal.add(response.multiply_const_factor(input_signal.func(t) * delta))
+
+        return constituent_impulses, coeffcients, output_signal
+
+    @instrument("LTIContinuous.output")
+    def output(self, input_signal, delta=0.01):
+        # Exact output when x and h both have closed forms (analytic.AnalyticSignal),
+        # otherwise fall back to the Riemann sum of output_approx
+        from .analytic import AnalyticSignal
+        if isinstance(input_signal, AnalyticSignal) and isinstance(self.impulse_response, AnalyticSignal):
+            return input_signal.convolve(self.impulse_response)
+        constituent_impulses, coeffcients, output_signal = self.output_approx(input_signal, delta)
+        return output_signal
+
+    def output_adaptive(self, input_signal, tol=1e-6, x_breakpoints=(), h_breakpoints=()):
+        # Output computed by adaptive quadrature (adaptive_convolution) over the same
+        # [-INF, INF] input range as output_approx, evaluated lazily for whatever t is asked for.
+        # Jumps of closed-form and sampled signals are found automatically; pass the jumps of
+        # plain ContinuousSignals as breakpoints so narrow pulses are not missed
+        x_breakpoints = np.concatenate([_breakpoints(input_signal), np.ravel(x_breakpoints)])
+        h_breakpoints = np.concatenate([_breakpoints(self.impulse_response), np.ravel(h_breakpoints)])
+
+        def output_func(t):
+            y_values, _ = adaptive_convolution(
+                input_signal.func, self.impulse_response.func, t, -input_signal.INF, input_signal.INF, tol,
+                x_breakpoints=x_breakpoints, h_breakpoints=h_breakpoints,
+            )
+            return y_values
+        return ContinuousSignal(output_func, input_signal.INF)
+
+    def series(self, other, delta=0.01):
+        """
+        The cascade x -> self -> other as one LTIContinuous with impulse response
+        h(t) = integral of h1(tau) h2(t - tau) dtau, computed once instead of paying
+        output_approx per stage. Exact (AnalyticSignal.convolve) when both responses have
+        closed forms; otherwise the same Riemann sum over tau in [-INF, INF) with step
+        delta as output_approx, done as one FFT convolution of the sampled responses and
+        returned as a SampledSignal on -INF..INF.
+        """
+        from .analytic import AnalyticSignal
+        from .sampled import SampledSignal
+        first, second = self.impulse_response, other.impulse_response
+        if isinstance(first, AnalyticSignal) and isinstance(second, AnalyticSignal):
+            return LTIContinuous(first.convolve(second))
+
+        INF = first.INF
+        tau = np.arange(-INF, INF, delta)
+        N = len(tau)
+        # h2 at every lag (m - j) * delta that h(t_m) = sum_j h1(tau_j) h2(t_m - tau_j) delta needs
+        lags = (np.arange(2 * N) - (N - 1)) * delta
+        size = 1 << int(3 * N - 2).bit_length()
+        full = np.fft.irfft(
+            np.fft.rfft(np.zeros(N) + first.func(tau), size) * np.fft.rfft(np.zeros(2 * N) + second.func(lags), size),
+            size,
+        )
+        t_grid = -INF + np.arange(N + 1) * delta
+        return LTIContinuous(SampledSignal(t_grid, full[N - 1:2 * N] * delta, INF))
+
+    def parallel(self, other):
+        """
+        Outputs of self and other added: one LTIContinuous with impulse response h1 + h2
+        (stays closed-form / sampled when both responses are).
+        """
+        return LTIContinuous(self.impulse_response.add(other.impulse_response))
+
+    @instrument("LTIContinuous.impulse_multiplied_by_coefficients_plot")
+    def impulse_multiplied_by_coefficients_plot(self, input_signal, delta):
+        #figure save 
+        import matplotlib.pyplot as plt
+        save_path = "Continuous"
+        os.makedirs(save_path, exist_ok=True)
+        save_filepath = os.path.join(save_path, "impulse_multiplied_by_coefficients_plot.png")
+
+
+        impulses, coefficients = self.linear_combination_of_impulses(input_signal, delta)
+        num_plots = len(impulses)
+        rows = num_plots // 3 + 1
+        cols = 3
+        fig, axes = plt.subplots(rows, cols, figsize=(15, 5 * rows))
+        fig.suptitle('Impulses Multiplied by Coefficients', fontsize=16)
+
+    # reconstructed_signal == ContinuousSignal(lambda t: np.sum([coeff * imp.func(t) for imp, coeff in zip(impulses, coefficients)]), INF=3)
+        reconstructed_signal = ContinuousSignal(lambda t : 0, input_signal.INF)
+        
+        # Iterate over each impulse and its coefficient to plot them in the grid
+        for idx, (imp, coeff) in enumerate(zip(impulses, coefficients)):
+            # Determine the row and column for the subplot
+            row = idx // cols
+            col = idx % cols
+            new_signal = imp.multiply_const_factor(coeff)
+            reconstructed_signal = reconstructed_signal.add(new_signal)
+            t_values = np.linspace(-input_signal.INF, input_signal.INF, 1000)
+            y_values = new_signal.evaluate(t_values)
+            
+            # Plot the signal in the corresponding subplot
+            ax = axes[row, col]
+            ax.plot(t_values, y_values)
+            ax.set_title(f'δ(t - ({idx - 6}∇)) x ({idx-6}∇)∇')  # Adjust title as needed
+            ax.set_xlabel('t (Time)')
+            ax.set_ylim(0.0, 1.2)
+            ax.set_ylabel('Amplitude')
+            ax.grid(True)
+
+        final_plot_idx = num_plots
+        final_row = final_plot_idx // cols
+        final_col = final_plot_idx % cols
+        # Plot the reconstructed signal
+        t_values = np.linspace(-input_signal.INF, input_signal.INF, 5000)
+        y_values = reconstructed_signal.evaluate(t_values)
+        ax = axes[final_row, final_col]
+        ax.plot(t_values, y_values)
+        ax.set_title('Reconstructed Signal')
+        ax.set_xlabel('t (Time)')
+        ax.set_ylabel('Amplitude')
+        ax.grid(True)
+        plt.tight_layout(rect=[0, 0, 1, 0.95])
+        with timer("matplotlib.render"):
+            plt.savefig(save_filepath, dpi=300)
+            plt.show()
+
+    @instrument("LTIContinuous.reconstructed_plot")
+    def reconstructed_plot(self, input_signal, deltas):
+        import matplotlib.pyplot as plt
+        save_path = "Continuous"
+        os.makedirs(save_path, exist_ok=True)
+        save_filepath = os.path.join(save_path, "reconstructed_plot.png")
+        # impulses, coefficients = self.linear_combination_of_impulses(input_signal, delta)
+        # reconstructed_signal = ContinuousSignal(lambda t: np.sum([coeff * imp.func(t) for imp, coeff in zip(impulses, coefficients)]), INF=input_signal.INF)
+        fig,axs = plt.subplots(int(len(deltas)/2), 2, figsize=(15, 5 * len(deltas)))
+        fig.suptitle("Reconstruction of input signal with varying Δ")
+
+        for i,delta in enumerate(deltas):
+            basis = self.impulse_basis(input_signal, delta)
+            t_values = np.linspace(-input_signal.INF, input_signal.INF, 5000)
+            y_values_xt = input_signal.evaluate(t_values)
+            y_values_reconstructed = basis.reconstruct(t_values)
+            row, col = divmod(i,2)
+            axs[row, col].plot(t_values, y_values_xt, 'orange', label="x(t)")
+            axs[row, col].step(t_values, y_values_reconstructed, 'b-', label="Reconstructed", where='post')
+            axs[row, col].set_title(f"Δ = {delta}")
+            axs[row, col].set_xlabel("t (Time)")
+            axs[row, col].set_ylabel("x(t)")
+            axs[row, col].legend()
+            axs[row, col].grid()
+
+        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+        with timer("matplotlib.render"):
+            plt.savefig(save_filepath, dpi=300)
+            plt.show()
+
+    @instrument("LTIContinuous.response_of_impulse_plot")
+    def response_of_impulse_plot(self, impulse_response,input_signal, delta):
+        import matplotlib.pyplot as plt
+        save_path = "Continuous"
+        os.makedirs(save_path, exist_ok=True)
+        save_filepath = os.path.join(save_path, "response_of_impulse_plot.png")
+        # return impulse.multiply(self.impulse_response)]
+        constituent_impulses, coefficients, output_signal = self.output_approx(input_signal, delta)
+        num_plots = len(constituent_impulses)
+        rows = num_plots // 3 + 1
+        cols = 3
+        fig, axes = plt.subplots(rows, cols, figsize=(15, 5 * rows))
+        fig.suptitle('Response of Impulse Signal', fontsize=16)
+        sum_signal = ContinuousSignal(lambda t : 0, input_signal.INF)
+        for idx, (imp, coeff) in enumerate(zip(constituent_impulses, coefficients)):
+            row = idx // cols
+            col = idx % cols
+            new_signal = imp.multiply_const_factor(coeff)
+            sum_signal = sum_signal.add(new_signal)
+            t_values = np.linspace(-input_signal.INF, input_signal.INF, 1000)
+            y_values = new_signal.evaluate(t_values)
+            ax = axes[row, col]
+            ax.plot(t_values, y_values)
+            ax.set_title(f'h(t - ({idx - 6}∇)) * ({idx-6}∇)∇')
+            ax.set_xlabel('t (Time)')
+            ax.set_ylim(0.0, 1.2)
+            ax.set_ylabel('x(t)')
+            ax.grid(True)
+        final_plot_idx = num_plots
+        final_row = final_plot_idx // cols
+        final_col = final_plot_idx % cols
+        t_values = np.linspace(-input_signal.INF, input_signal.INF, 5000)
+        y_values = sum_signal.evaluate(t_values)
+        ax = axes[final_row, final_col]
+        ax.plot(t_values, y_values)
+        ax.set_title('Output = Sum')
+        ax.set_xlabel('t (Time)')
+        ax.set_ylabel('Amplitude')
+        ax.grid(True)
+        plt.tight_layout(rect=[0, 0, 1, 0.95])
+        with timer("matplotlib.render"):
+            plt.savefig(save_filepath, dpi=300)
+            plt.show()
+        # self.reconstructed_plot(output_signal, [0.5, 0.1, 0.05,0.01])
+
+
+
+
+        # for imp, coeff in zip(constituent_impulses, coefficients):
+        #     print(coeff)
+        #     imp.plot("before")
+        #     new_signal = imp.multiply_const_factor(coeff)
+        #     new_signal.plot("after")
+        #     # t_values = np.linspace(-imp.INF, imp.INF, 5000)
+        #     # y_values = [new_signal.func(t) for t in t_values]
+        #     # plt.plot(t_values, y_values)
+        #     # plt.title(f'δ(t - ({idx - 6}∇)) x ({idx-6}∇)∇')
+
+#Reconstructed output plot 
+
+    @instrument("LTIContinuous.reconstructed_output_plot")
+    def reconstructed_output_plot(self, input_signal,actual_output_signal, deltas):
+        import matplotlib.pyplot as plt
+        save_path = "Continuous"
+        os.makedirs(save_path, exist_ok=True)
+        save_filepath = os.path.join(save_path, "reconstructed_output_plot.png")
+
+        # impulses, coefficients = self.linear_combination_of_impulses(input_signal, delta)
+        # reconstructed_signal = ContinuousSignal(lambda t: np.sum([coeff * imp.func(t) for imp, coeff in zip(impulses, coefficients)]), INF=input_signal.INF)
+        # constituent_impulses, coefficients, output_signal = self.output_approx(input_signal, delta)
+        fig,axs = plt.subplots(int(len(deltas)/2), 2, figsize=(15, 5 * len(deltas)))
+        fig.suptitle("Reconstruction of output signal with varying Δ")
+
+        for i,delta in enumerate(deltas):
+            # impulses, coefficients = self.linear_combination_of_impulses(output_signal, delta) 
+            constituent_impulses, coefficients, output_signal = self.output_approx(input_signal, delta)
+            reconstructed_signal = ContinuousSignal(lambda t : 0, output_signal.INF)  
+            t_values = np.linspace(-output_signal.INF, output_signal.INF, 5000)
+            y_values_xt = actual_output_signal.evaluate(t_values)
+            y_values_reconstructed = output_signal.evaluate(t_values)
+            row, col = divmod(i,2)
+            axs[row, col].plot(t_values, y_values_xt, 'orange', label="x(t)")
+            axs[row, col].step(t_values, y_values_reconstructed, 'b-', label="Reconstructed", where='post')
+            axs[row, col].set_title(f"Δ = {delta}")
+            axs[row, col].set_xlabel("t (Time)")
+            axs[row, col].set_ylabel("x(t)")
+            axs[row, col].legend()
+            axs[row, col].grid()
+
+        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+        with timer("matplotlib.render"):
+            plt.savefig(save_filepath, dpi=300)
+            plt.show()
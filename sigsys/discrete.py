@@ -0,0 +1,527 @@
+import numpy as np 
+import os
+from functools import lru_cache
+
+from .impulse_basis import PulseBasis
+from .fourier_transform import TILE_BYTES
+from .instrumentation import instrument, timer
+from .spectrum import Spectrum
+
+# dtft() takes the FFT route only while the FFT size stays within this factor of the
+# direct sum's output and input lengths
+DTFT_FFT_SIZE_FACTOR = 4
+
+
+def _dft_grid_size(omega):
+    # M if omega lies on the M-point DFT grid 2 pi k / M (uniform, starting on a bin), else None
+    if len(omega) < 2:
+        return None
+    step = omega[1] - omega[0]
+    if step <= 0:
+        return None
+    M = 2 * np.pi / step
+    if abs(M - round(M)) > 1e-9 * M or not np.allclose(np.diff(omega), step, rtol=1e-9, atol=0):
+        return None
+    M = int(round(M))
+    k0 = omega[0] / (2 * np.pi / M)
+    return M if abs(k0 - round(k0)) < 1e-6 else None
+
+
+@lru_cache(maxsize=64)
+def _time_indices(INF):
+    # One read-only index array per INF, shared by every signal of that length; bounded, so
+    # a process that sees many different lengths only keeps the recent ones
+    time_indices = np.arange(-INF, INF + 1)
+    time_indices.setflags(write=False)
+    return time_indices
+
+
+class DiscreteSignal : 
+    # No per-instance __dict__: a signal is its INF and its value buffer
+    __slots__ = ("INF", "values")
+
+    def __init__(self, INF, dtype=np.float64):
+        self.INF = INF
+        self.values = np.zeros(2 * INF +1, dtype=dtype)  # Create a signal array of size 2 * INF + 1 (to cover -INF to INF); e.g. np.float32 to halve memory for audio / price data
+
+    @classmethod
+    def _from_values(cls, INF, values):
+        # Wrap an already computed buffer without allocating (and then discarding) zeros
+        signal = cls.__new__(cls)
+        signal.INF = INF
+        signal.values = values
+        return signal
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def time_indices(self):
+        return _time_indices(self.INF)
+
+    def set_value_at_time(self, time, value):
+        if -self.INF <= time <= self.INF:
+            self.values[time + self.INF] = value  # Shift the index for proper placement
+        else:
+            raise ValueError("Time index out of range")
+
+    def astype(self, dtype):
+        return DiscreteSignal._from_values(self.INF, self.values.astype(dtype))
+
+    @instrument("DiscreteSignal.shift_signal", samples=lambda self, *args: len(self.values))
+    def shift_signal(self, shift):
+        return DiscreteSignal._from_values(self.INF, np.roll(self.values, shift))
+
+    @instrument("DiscreteSignal.add", samples=lambda self, *args: len(self.values))
+    def add(self, other):
+        if self.INF != other.INF:
+            raise ValueError("Both signals must have the same INF value")
+        return DiscreteSignal._from_values(self.INF, self.values + other.values)
+
+    @instrument("DiscreteSignal.multiply", samples=lambda self, *args: len(self.values))
+    def multiply(self, other):
+        if self.INF != other.INF:
+            raise ValueError("Both signals must have the same INF value")
+        return DiscreteSignal._from_values(self.INF, self.values * other.values)
+
+    @instrument("DiscreteSignal.multiply_const_factor", samples=lambda self, *args: len(self.values))
+    def multiply_const_factor(self, factor):
+        return DiscreteSignal._from_values(self.INF, self.values * factor)
+
+    @instrument("DiscreteSignal.dtft", samples=lambda self, *args, **kwargs: len(self.values))
+    def dtft(self, omega=None, n_fft=None):
+        """
+        X(e^jw) = sum over n of x[n] e^(-jwn), n running from -INF to INF.
+
+        Parameters:
+        - omega: Angular frequencies (rad/sample). None gives the n_fft-point grid on
+          [-pi, pi). A uniform grid of DFT bins 2 pi k / M (e.g. that grid, or bins from
+          0 to 2 pi) is computed with one FFT of size M, zero-padded or time-aliased as
+          needed, when M is at most DTFT_FFT_SIZE_FACTOR * max(len(omega), length); any
+          other grid is summed directly, TILE_BYTES of exponentials at a time, so memory
+          does not grow with len(omega) * length.
+        - n_fft: Points of the default grid (default: the next power of two >= 8 * length,
+          zero-padding so the curve is smooth).
+
+        Returns:
+        - A Spectrum whose frequencies are omega (rad/sample), complex64 for a float32
+          signal.
+        """
+        N = len(self.values)
+        complex_dtype = np.result_type(self.dtype, np.complex64)
+        if omega is None:
+            n_fft = n_fft or 1 << int(8 * N - 1).bit_length()
+            omega = 2 * np.pi * (np.arange(n_fft) - n_fft // 2) / n_fft
+        omega = np.asarray(omega, dtype=float)
+        M = _dft_grid_size(omega)
+        if M is not None and M <= DTFT_FFT_SIZE_FACTOR * max(len(omega), N):
+            # Fold the sequence onto M points (zero-pads when M >= N), then pick the bins
+            folded = np.zeros(M, dtype=self.dtype)
+            np.add.at(folded, np.arange(N) % M, self.values)
+            bins = np.fft.fft(folded)[np.rint(omega / (2 * np.pi / M)).astype(int) % M].astype(complex_dtype)
+        else:
+            # A few rows of the len(omega) x N exponential matrix at a time. The phases stay
+            # float64 (in float32 they lose ~1e-4 rad at n ~ 1000); only the result takes the
+            # signal's precision
+            bins = np.empty(len(omega), dtype=complex_dtype)
+            n = np.arange(N)
+            rows_per_tile = max(1, TILE_BYTES // (16 * N))
+            for start in range(0, len(omega), rows_per_tile):
+                stop = start + rows_per_tile
+                bins[start:stop] = np.exp(-1j * np.outer(omega[start:stop], n)) @ self.values
+        # values[0] sits at n = -INF
+        return Spectrum(bins * np.exp(1j * omega * self.INF).astype(complex_dtype), omega)
+
+    @instrument("DiscreteSignal.plot")
+    def plot(self, title="Discrete Signal"):
+        import matplotlib.pyplot as plt
+        save_path = "Discrete"
+        os.makedirs(save_path, exist_ok=True)
+        save_filepath = os.path.join(save_path, f"{title}.png")
+        
+        # Generate discrete time points
+        t_values = self.time_indices
+        y_values = self.values
+
+        plt.figure(figsize=(10, 6))
+        plt.stem(t_values, y_values)  # Use stem plot for discrete signal
+        plt.title(title)
+        plt.xlabel('Time (t)')
+        plt.ylabel('Signal Value')
+        plt.grid(True)
+        with timer("matplotlib.render"):
+            plt.savefig(save_filepath, dpi=300)  # Save the plot as a high-quality PNG file
+            plt.show()
+
+        print(f"Plot saved as {save_filepath}")
+
+
+
+class LTI_Discrete:
+    def __init__(self, impulse_response, dtype=None):
+        # dtype=None keeps the precision of the impulse response
+        if dtype is not None and np.dtype(dtype) != impulse_response.dtype:
+            impulse_response = impulse_response.astype(dtype)
+        self.impulse_response = impulse_response
+        self.dtype = impulse_response.dtype
+
+    @instrument("LTI_Discrete.linear_combination_of_impulses", samples=lambda self, input_signal: len(input_signal.values))
+    def linear_combination_of_impulses(self, input_signal):
+        impulses = []
+        coefficients = input_signal.values
+        for t in range(-input_signal.INF, input_signal.INF+1):
+            print(t)
+            impulse = DiscreteSignal(input_signal.INF, self.dtype)
+            impulse.set_value_at_time(t,1)
+            impulses.append(impulse)
+        return impulses, coefficients
+
+    @instrument("LTI_Discrete.impulse_basis", samples=lambda self, input_signal: len(input_signal.values))
+    def impulse_basis(self, input_signal):
+        # Same decomposition as linear_combination_of_impulses, as arrays: unit-width pulses
+        # starting at every time index, weighted by the signal values
+        return PulseBasis(input_signal.time_indices, 1, input_signal.values)
+
+    @instrument("LTI_Discrete.output", samples=lambda self, input_signal: len(input_signal.values))
+    def output(self, input_signal):
+        INF = input_signal.INF
+        output_signal = DiscreteSignal(INF, self.dtype)
+        constituent_impulses = []
+        coefficients = input_signal.values
+        # output_signal = DiscreteSignal( INF)
+        for i in range(-INF, INF + 1):
+            # coefficients.append(input_signal.values[INF + i])
+            # response = self.impulse_response.shift_signal(i)
+            # constituent_impulses.append(response)
+            response = self.impulse_response.shift_signal(i)
+            # response.set_value_at_time(i,1)
+            constituent_impulses.append(response)
+            output_signal = output_signal.add(
+                response.multiply_const_factor(input_signal.values[INF + i])
+            )
+        return output_signal, constituent_impulses, coefficients
+
+    def frequency_response(self, omega=None, n_fft=None):
+        """
+        H(e^jw), the DTFT of the impulse response (see DiscreteSignal.dtft).
+        """
+        return self.impulse_response.dtft(omega, n_fft)
+
+    @instrument("LTI_Discrete.output_fft", samples=lambda self, input_signal, *args, **kwargs: len(input_signal.values))
+    def output_fft(self, input_signal, mode="circular"):
+        """
+        Output signal as the inverse DFT of X * H, in O(N log N).
+
+        Parameters:
+        - input_signal: DiscreteSignal with the same INF as the impulse response.
+        - mode: "circular" gives exactly the output_signal of output() (which shifts with
+          np.roll, so responses running past INF wrap around); "linear" zero-pads, so
+          the response is the true convolution truncated to -INF..INF.
+
+        Returns:
+        - output_signal: DiscreteSignal in the system's precision.
+        """
+        if input_signal.INF != self.impulse_response.INF:
+            raise ValueError("Both signals must have the same INF value")
+        if mode not in ("circular", "linear"):
+            raise ValueError("mode must be 'circular' or 'linear'")
+        INF = input_signal.INF
+        N = len(input_signal.values)
+        size = N if mode == "circular" else 1 << int(2 * N - 2).bit_length()
+        product = np.fft.rfft(input_signal.values, size) * np.fft.rfft(self.impulse_response.values, size)
+        full = np.fft.irfft(product, size)
+        # y[n] = sum_k x[k] h[n - k]: value index m of y is index m + INF of the product
+        values = np.roll(full, -INF)[:N] if mode == "circular" else full[INF:INF + N]
+        return DiscreteSignal._from_values(INF, values.astype(self.dtype))
+
+    def series(self, other, mode="circular"):
+        """
+        The cascade x -> self -> other as one LTI_Discrete. Its impulse response h1 * h2 is
+        computed once with output_fft, so the composite costs one pass per input instead of
+        one per stage. With mode="circular" its output() equals running output() through
+        both systems in turn; "linear" gives the truncated true convolution of the kernels.
+        other can also be an LTI_IIR (its impulse response is truncated to -INF..INF).
+        """
+        if isinstance(other, LTI_IIR):
+            other = other.to_fir(self.impulse_response.INF)
+        kernel = LTI_Discrete(other.impulse_response, np.result_type(self.dtype, other.dtype))
+        return LTI_Discrete(kernel.output_fft(self.impulse_response, mode))
+
+    def parallel(self, other):
+        """
+        self and other fed the same input with their outputs added, as one LTI_Discrete
+        whose impulse response is h1 + h2. other can also be an LTI_IIR (truncated).
+        """
+        if isinstance(other, LTI_IIR):
+            other = other.to_fir(self.impulse_response.INF)
+        return LTI_Discrete(self.impulse_response.add(other.impulse_response))
+
+    @instrument("LTI_Discrete.frequency_response_plot")
+    def frequency_response_plot(self, title="Frequency Response"):
+        # Magnitude (dB) and phase of H(e^jw) on [-pi, pi)
+        import matplotlib.pyplot as plt
+        save_path = "Discrete"
+        os.makedirs(save_path, exist_ok=True)
+        save_filepath = os.path.join(save_path, f"{title}.png")
+
+        response = self.frequency_response()
+        fig, (ax_mag, ax_phase) = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
+        fig.suptitle(title, fontsize=16)
+        ax_mag.plot(response.frequencies, 20 * np.log10(np.maximum(response.magnitude(), 1e-12)))
+        ax_mag.set_ylabel('|H| (dB)')
+        ax_mag.grid(True)
+        ax_phase.plot(response.frequencies, np.unwrap(response.phase()))
+        ax_phase.set_xlabel('ω (rad/sample)')
+        ax_phase.set_ylabel('Phase (rad)')
+        ax_phase.grid(True)
+        with timer("matplotlib.render"):
+            plt.savefig(save_filepath, dpi=300)
+            plt.show()
+
+    @instrument("LTI_Discrete.impulse_multiplied_by_coefficients_plot")
+    def impulse_multiplied_by_coefficients_plot(self, input_signal):
+        # Save figure path setup
+        import matplotlib.pyplot as plt
+        save_path = "Discrete"
+        os.makedirs(save_path, exist_ok=True)
+        save_filepath = os.path.join(save_path, "impulse_multiplied_by_coefficients_plot.png")
+
+        impulses, coefficients = self.linear_combination_of_impulses(input_signal)
+        num_plots = len(impulses)
+        rows = num_plots // 3 + 1
+        cols = 3
+        fig, axes = plt.subplots(rows, cols, figsize=(15, 5 * rows))
+        fig.suptitle('Impulses Multiplied by Coefficients (Discrete)', fontsize=16)
+
+        # Initialize reconstructed_signal as zero for discrete signals
+        reconstructed_signal = DiscreteSignal(input_signal.INF)
+
+        # Iterate over each impulse and its coefficient to plot them in the grid
+        for idx, (imp, coeff) in enumerate(zip(impulses, coefficients)):
+            # Determine the row and column for the subplot
+            row = idx // cols
+            col = idx % cols
+
+            new_signal = imp.multiply_const_factor(coeff)
+            reconstructed_signal = reconstructed_signal.add(new_signal)
+            # t_values = np.arange(-input_signal.INF, input_signal.INF + self.step, self.step)
+            # y_values = [new_signal.func(t) for t in t_values]
+            t_values = new_signal.time_indices
+            y_values = new_signal.values
+
+            # Plot the signal in the corresponding subplot using stem plot
+            ax = axes[row, col]
+            ax.stem(t_values, y_values)
+            ax.set_title(f'δ[n-({-imp.INF+idx})]*[{-imp.INF+idx}]')
+            ax.set_xlabel('n (Time Step)')
+            ax.set_ylabel('x[n]')
+            ax.set_ylim(-1, 4)
+            ax.grid(True)
+
+        # Plot the reconstructed signal in the final position
+        final_plot_idx = num_plots
+        final_row = final_plot_idx // cols
+        final_col = final_plot_idx % cols
+        # t_values = np.arange(-input_signal.INF, input_signal.INF + self.step, self.step)
+        t_values = reconstructed_signal.time_indices
+        y_values = reconstructed_signal.values
+        # y_values = [reconstructed_signal.func(t) for t in t_values]
+
+        ax = axes[final_row, final_col]
+        ax.stem(t_values, y_values)
+        ax.set_title('Reconstructed Signal')
+        ax.set_xlabel('n (Time Step)')
+        ax.set_ylabel('x[n]')
+        ax.set_ylim(-1, 4)
+        ax.grid(True)
+
+        plt.tight_layout(rect=[0, 0, 1, 0.95])
+        with timer("matplotlib.render"):
+            plt.savefig(save_filepath, dpi=300)
+            plt.show()
+
+    @instrument("LTI_Discrete.response_of_input_plot")
+    def response_of_input_plot(self, input_signal):
+        # Save figure path setup
+        import matplotlib.pyplot as plt
+        save_path = "Discrete"
+        os.makedirs(save_path, exist_ok=True)
+        save_filepath = os.path.join(save_path, "response_of_input_plot.png")
+
+        output_signal, constituent_impulses, coefficients = self.output(input_signal)
+        num_plots = len(constituent_impulses)
+        rows = num_plots // 3 + 1
+        cols = 3
+        fig, axes = plt.subplots(rows, cols, figsize=(15, 5 * rows))
+        fig.suptitle('Response of Input Signal (Discrete)', fontsize=16)
+
+        # Initialize reconstructed_signal as zero for discrete signals
+        reconstructed_signal = DiscreteSignal(input_signal.INF)
+
+        # Iterate over each impulse and its coefficient to plot them in the grid
+        for idx, (imp, coeff) in enumerate(zip(constituent_impulses, coefficients)):
+            # Determine the row and column for the subplot
+            row = idx // cols
+            col = idx % cols
+
+            new_signal = imp.multiply_const_factor(coeff)
+            reconstructed_signal = reconstructed_signal.add(new_signal)
+            # t_values = np.arange(-input_signal.INF, input_signal.INF + self.step, self.step)
+            # y_values = [new_signal.func(t) for t in t_values]
+            t_values = new_signal.time_indices
+            y_values = new_signal.values
+
+            # Plot the signal in the corresponding subplot using stem plot
+            ax = axes[row, col]
+            ax.stem(t_values, y_values)
+            ax.set_title(f'h[n-({-imp.INF+idx})]*[{-imp.INF+idx}]')
+            ax.set_xlabel('n (Time Step)')
+            ax.set_ylabel('x[n]')
+            ax.set_ylim(-1, 4)
+            ax.grid(True)
+
+        # Plot the reconstructed signal in the final position
+        final_plot_idx = num_plots
+        final_row = final_plot_idx // cols
+        final_col = final_plot_idx % cols
+        # t_values = np.arange(-input_signal.INF, input_signal.INF + self.step, self.step)
+        t_values = reconstructed_signal.time_indices
+        y_values = reconstructed_signal.values
+        # y_values = [reconstructed_signal.func(t) for t in t_values]
+
+        ax = axes[final_row, final_col]
+        ax.stem(t_values, y_values)
+        ax.set_title('Output = Sum')
+        ax.set_xlabel('n (Time Step)')
+        ax.set_ylabel('x[n]')
+        ax.set_ylim(-1, 4)
+        ax.grid(True)
+
+        plt.tight_layout(rect=[0, 0, 1, 0.95])
+        with timer("matplotlib.render"):
+            plt.savefig(save_filepath, dpi=300)
+            plt.show()
+
+
+class LTI_IIR:
+    def __init__(self, b, a=(1.0,), dtype=np.float64):
+        """
+        LTI system given by its difference equation
+            a[0] y[n] + a[1] y[n-1] + ... = b[0] x[n] + b[1] x[n-1] + ...
+        so feedback systems (exponential smoothing, resonators, ...) do not have to be
+        truncated into a long impulse response. Filtering runs in O(N * order) with
+        scipy.signal.lfilter (SciPy is imported on first use).
+
+        Parameters:
+        - b: Feed-forward coefficients.
+        - a: Feedback coefficients, a[0] != 0 (default: FIR, like LTI_Discrete).
+        - dtype: Precision of the outputs and of the state.
+        """
+        b = np.atleast_1d(np.asarray(b, dtype=float))
+        a = np.atleast_1d(np.asarray(a, dtype=float))
+        if a[0] == 0:
+            raise ValueError("a[0] must not be zero")
+        self.b = b / a[0]
+        self.a = a / a[0]
+        self.dtype = np.dtype(dtype)
+        self.reset()
+
+    @classmethod
+    def exponential_smoothing(cls, alpha, dtype=np.float64):
+        # y[n] = alpha x[n] + (1 - alpha) y[n-1]
+        return cls([alpha], [1.0, -(1.0 - alpha)], dtype)
+
+    @property
+    def order(self):
+        return max(len(self.a), len(self.b)) - 1
+
+    @property
+    def delay(self):
+        # No block delay: process() returns the output of every input sample immediately
+        return 0
+
+    def reset(self):
+        """
+        Forget the stream state (zero initial conditions).
+        """
+        self._state = np.zeros(self.order, dtype=self.dtype)
+
+    def _filter(self, values, state):
+        from scipy.signal import lfilter
+
+        values = np.asarray(values).astype(self.dtype, copy=False)
+        if not self.order:
+            return values * self.dtype.type(self.b[0]), state
+        return lfilter(self.b.astype(self.dtype), self.a.astype(self.dtype), values, zi=state)
+
+    @instrument("LTI_IIR.process", samples=lambda self, block: len(block))
+    def process(self, block):
+        """
+        Filter the next block of a stream; the state carries over to the next call, so the
+        concatenated outputs equal filtering the whole stream at once.
+        """
+        output, self._state = self._filter(block, self._state)
+        return output
+
+    def skip(self, block):
+        # Same state update as process() (for dropped stream frames)
+        self.process(block)
+
+    @instrument("LTI_IIR.output", samples=lambda self, input_signal: len(input_signal.values))
+    def output(self, input_signal):
+        """
+        Response to a DiscreteSignal, starting at rest at n = -INF (the stream state is
+        not used or changed).
+        """
+        output, _ = self._filter(input_signal.values, np.zeros(self.order, dtype=self.dtype))
+        return DiscreteSignal._from_values(input_signal.INF, output)
+
+    def impulse_response(self, INF):
+        """
+        h[n] for n = -INF..INF (zero before 0), e.g. to build a truncated LTI_Discrete.
+        """
+        impulse = DiscreteSignal(INF, self.dtype)
+        impulse.set_value_at_time(0, 1)
+        return self.output(impulse)
+
+    def to_fir(self, INF):
+        """
+        LTI_Discrete with the impulse response truncated to n = -INF..INF.
+        """
+        return LTI_Discrete(self.impulse_response(INF))
+
+    def series(self, other):
+        """
+        The cascade x -> self -> other. With another LTI_IIR this is exact and stays
+        recursive: B = B1 B2, A = A1 A2. With an LTI_Discrete both become FIR (self is
+        truncated to the other's INF), see LTI_Discrete.series.
+        """
+        if isinstance(other, LTI_Discrete):
+            return self.to_fir(other.impulse_response.INF).series(other)
+        return LTI_IIR(np.convolve(self.b, other.b), np.convolve(self.a, other.a),
+                       np.result_type(self.dtype, other.dtype))
+
+    def parallel(self, other):
+        """
+        Outputs of self and other added. With another LTI_IIR: B = B1 A2 + B2 A1, A = A1 A2.
+        """
+        if isinstance(other, LTI_Discrete):
+            return self.to_fir(other.impulse_response.INF).parallel(other)
+        b1, b2 = np.convolve(self.b, other.a), np.convolve(other.b, self.a)
+        b = np.zeros(max(len(b1), len(b2)))
+        b[:len(b1)] += b1
+        b[:len(b2)] += b2
+        return LTI_IIR(b, np.convolve(self.a, other.a), np.result_type(self.dtype, other.dtype))
+
+    def frequency_response(self, omega=None, n_fft=None):
+        """
+        H(e^jw) = B(e^jw) / A(e^jw), exact on any grid (default: n_fft points on [-pi, pi)).
+        """
+        if omega is None:
+            n_fft = n_fft or 1024
+            omega = 2 * np.pi * (np.arange(n_fft) - n_fft // 2) / n_fft
+        omega = np.asarray(omega, dtype=float)
+        z = np.exp(-1j * omega)
+        # Polynomials in z^-1; np.polyval wants the highest power first
+        return Spectrum(np.polyval(self.b[::-1], z) / np.polyval(self.a[::-1], z), omega)
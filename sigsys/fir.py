@@ -0,0 +1,75 @@
+import numpy as np
+
+
+def lowpass_taps(cutoff, sample_rate, num_taps=101, beta=8.0):
+    """
+    Windowed-sinc (Kaiser) low-pass FIR filter with unit gain at DC.
+
+    Parameters:
+    - cutoff: Cutoff frequency (Hz), the middle of the transition band.
+    - sample_rate: Sampling rate (Hz) the filter runs at.
+    - num_taps: Filter length; odd, so the delay is a whole number of samples. The
+      transition band is roughly 5.5 * sample_rate / num_taps wide for beta = 8.
+    - beta: Kaiser window shape; 8 gives about 80 dB of stop-band attenuation.
+
+    Returns:
+    - taps: Array of num_taps coefficients, symmetric (linear phase).
+    """
+    if num_taps % 2 == 0:
+        raise ValueError("num_taps must be odd")
+    if not 0 < cutoff < sample_rate / 2:
+        raise ValueError("cutoff must be between 0 and sample_rate / 2")
+    fc = cutoff / sample_rate
+    n = np.arange(num_taps) - (num_taps - 1) / 2
+    taps = 2 * fc * np.sinc(2 * fc * n) * np.kaiser(num_taps, beta)
+    return taps / taps.sum()
+
+
+def highpass_taps(cutoff, sample_rate, num_taps=101, beta=8.0):
+    """
+    High-pass counterpart of lowpass_taps (spectral inversion: a delayed impulse minus the
+    low-pass), i.e. the FIR version of Spectrum.high_pass(cutoff).
+    """
+    taps = -lowpass_taps(cutoff, sample_rate, num_taps, beta)
+    taps[(num_taps - 1) // 2] += 1
+    return taps
+
+
+class FIRStream:
+    __slots__ = ("taps", "_history")
+
+    def __init__(self, taps, dtype=np.float64):
+        """
+        Apply an FIR filter to a signal that arrives in blocks.
+
+        The last len(taps) - 1 input samples are kept between calls, so the concatenated
+        outputs equal np.convolve(whole_input, taps)[:len(whole_input)].
+        """
+        self.taps = np.asarray(taps, dtype=dtype)
+        self._history = np.zeros(len(self.taps) - 1, dtype=dtype)
+
+    @property
+    def delay(self):
+        # Group delay in samples (linear-phase taps)
+        return (len(self.taps) - 1) / 2
+
+    def reset(self):
+        self._history[:] = 0
+
+    def _extend(self, block):
+        extended = np.concatenate((self._history, np.asarray(block, dtype=self.taps.dtype)))
+        if len(self._history):
+            self._history = extended[-len(self._history):].copy()
+        return extended
+
+    def process(self, block):
+        """
+        Filter one block; returns as many samples as the block has.
+        """
+        return np.convolve(self._extend(block), self.taps, mode="valid")
+
+    def skip(self, block):
+        """
+        Advance the state over a block without producing output (e.g. a dropped frame).
+        """
+        self._extend(block)
@@ -0,0 +1,476 @@
+import numpy as np
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .instrumentation import instrument
+
+class FourierSeries:
+    def __init__(self, func, L, terms=10, dtype=np.float64):
+        """
+        Initialize the FourierSeries class with a target function, 2*np.pi L, and number of terms.
+        
+        Parameters:
+        - func: The target function to approximate.
+        - L: Half the 2*np.pi of the target function.
+        - terms: Number of terms to use in the Fourier series expansion.
+        - dtype: Precision used for sampling and synthesis (np.float64 or np.float32).
+        """
+        self.func = func
+        self.L = L
+        self.terms = terms
+        self.dtype = np.dtype(dtype)
+
+    def _sample(self, N):
+        x = np.linspace(-self.L, self.L, N, dtype=self.dtype)
+        return x, np.asarray(self.func(x)).astype(self.dtype, copy=False)
+
+    def calculate_a0(self, N=1000):
+        """
+        Compute the a0 coefficient, which is the average (DC component) of the function over one 2*np.pi.
+        
+        Parameters:
+        - N: Number of points to use for integration.
+        
+        Returns:
+        - a0: The computed a0 coefficient.
+        """
+        x, y = self._sample(N)
+        a0 = np.trapz(y, x) / ( self.L)  # Trapezoidal integration
+        return a0
+
+    def calculate_an(self, n, N=1000):
+        """
+        Compute the an coefficient for the nth cosine term in the Fourier series.
+        
+        Parameters:
+        - n: Harmonic number to calculate the nth cosine coefficient.
+        - N: Number of points to use for numerical integration.
+        
+        Returns:
+        - an: The computed an coefficient.
+        """
+        x, y = self._sample(N)
+        y = y * np.cos(self.dtype.type(n * np.pi / self.L) * x)
+        an = np.trapz(y, x) / self.L
+        return an
+
+    def calculate_bn(self, n, N=1000):
+        """
+        Compute the bn coefficient for the nth sine term in the Fourier series.
+        
+        Parameters:
+        - n: Harmonic number to calculate the nth sine coefficient.
+        - N: Number of points to use for numerical integration.
+        
+        Returns:
+        - bn: The computed bn coefficient.
+        """
+        x, y = self._sample(N)
+        y = y * np.sin(self.dtype.type(n * np.pi / self.L) * x)
+        bn = np.trapz(y, x) / self.L
+        return bn
+
+    def fft_coefficients(self, terms=None, tol=1e-6, N=None):
+        """
+        All coefficients up to `terms` from one FFT of a period; see fft_coefficients().
+
+        Returns:
+        - a0, an, bn: an and bn are arrays, index n - 1 holding harmonic n.
+        """
+        a0, an, bn = fft_coefficients(self.func, self.L, self.terms if terms is None else terms, tol, N)
+        return self.dtype.type(a0), an.astype(self.dtype), bn.astype(self.dtype)
+
+    def approximate(self, x, weights=None):
+        """
+        Use the calculated coefficients to build the Fourier series approximation.
+        
+        Parameters:
+        - x: Points at which to evaluate the Fourier series.
+        - weights: None, "lanczos" or "fejer" (see synthesize).
+        
+        Returns:
+        - The Fourier series approximation evaluated at each point in x.
+        """
+        # Same trapezoid coefficients as calculate_a0/an/bn, all from one matrix product
+        a0, an, bn = series_coefficients([self.func], self.L, self.terms, dtype=self.dtype)
+        return synthesize(a0[0], an[0], bn[0], x, self.L, weights).astype(self.dtype, copy=False)
+
+    def plot(self):
+        """
+        Plot the original function and its Fourier series approximation.
+        """
+        import matplotlib.pyplot as plt
+
+        x = np.linspace(-self.L, self.L, 1000)
+        original = self.func(x)
+        approximation = self.approximate(x)
+
+        plt.figure(figsize=(10, 6))
+        plt.plot(x, original, label="Original Function", color="blue")
+        plt.plot(x, approximation, label=f"Fourier Series Approximation (N={self.terms})", color="red", linestyle="--")
+        plt.xlabel("x")
+        plt.ylabel("f(x)")
+        plt.legend()
+        plt.title("Fourier Series Approximation")
+        plt.grid(True)
+        plt.show()
+
+
+class FourierCoefficients:
+    __slots__ = ("a0", "an", "bn", "L")
+
+    def __init__(self, a0, an, bn, L):
+        """
+        A coefficient set as returned by fft_coefficients / series_coefficients, together
+        with its half-period, so it can be stored (sigsys.storage) and synthesized later.
+        Unpacks like the tuples: a0, an, bn = coefficients.
+        """
+        self.a0 = float(a0)
+        self.an = np.asarray(an)
+        self.bn = np.asarray(bn)
+        self.L = float(L)
+        if self.an.shape != self.bn.shape or self.an.ndim != 1:
+            raise ValueError("an and bn must be 1-D arrays of the same length")
+
+    def __iter__(self):
+        return iter((self.a0, self.an, self.bn))
+
+    def __len__(self):
+        return len(self.an)
+
+    def synthesize(self, x, weights=None, method="auto"):
+        return synthesize(self.a0, self.an, self.bn, x, self.L, weights, method)
+
+
+def _periodic_samples(func, L, N):
+    return np.asarray(func(-L + (2 * L / N) * np.arange(N)), dtype=float)
+
+
+def _coefficients_from_samples(y, terms):
+    # With x_k = -L + 2Lk/N, e^(-i n pi x_k / L) = (-1)^n e^(-2 pi i n k / N), so the rFFT bins
+    # only need a sign flip on odd harmonics
+    spectrum = np.fft.rfft(y)[:terms + 1] * (2 / len(y))
+    spectrum[1::2] *= -1
+    return float(spectrum[0].real), spectrum[1:].real, -spectrum[1:].imag
+
+
+@instrument("fft_coefficients", samples=lambda func, L, terms, *args, **kwargs: terms)
+def fft_coefficients(func, L, terms, tol=1e-6, N=None, max_N=2 ** 20):
+    """
+    a0 and an, bn for n = 1..terms from one real FFT of a period, in O(N log N).
+
+    The period is sampled on N equally spaced points (the endpoint, which repeats the
+    start, is left out). Harmonics above N / 2 alias onto the ones asked for, so unless N
+    is given it starts at the smallest power of two above 4 * terms and doubles. A jump
+    that falls on a sample point (as in the square and sawtooth waveforms of
+    target_function, whose jumps sit at multiples of L) leaves an error
+    proportional to 1 / N, so each doubling is combined with the previous grid by Richardson
+    extrapolation, 2 c(2N) - c(N), which cancels that term; the doubling stops once the
+    extrapolated coefficients change by at most tol, and that change is an estimate of the
+    remaining error. Jumps between sample points still converge only like 1 / N and may end
+    at max_N. Each doubling reuses the previous samples and only evaluates func on the new
+    midpoints.
+
+    Parameters:
+    - func: Vectorized target function with period 2 * L.
+    - L: Half-period.
+    - terms: Highest harmonic returned.
+    - tol: Target absolute aliasing error of every coefficient.
+    - N: Fixed number of samples (> 2 * terms) instead of the automatic choice.
+    - max_N: Upper bound for the automatic choice; the estimate at max_N is returned
+      with a RuntimeWarning if it has not reached tol.
+
+    Returns:
+    - a0: Same convention as calculate_a0 (twice the mean value).
+    - an, bn: Arrays of length terms; index n - 1 holds harmonic n.
+    """
+    if N is not None:
+        if N <= 2 * terms:
+            raise ValueError("N must be larger than 2 * terms")
+        return _coefficients_from_samples(_periodic_samples(func, L, N), terms)
+
+    N = 1 << max(int(4 * terms).bit_length(), 4)
+    y = _periodic_samples(func, L, N)
+    coefficients = _coefficients_from_samples(y, terms)
+    estimate, change = coefficients, np.inf
+    while N < max_N:
+        # The 2N grid is the N grid plus the midpoints between its samples
+        refined = np.empty(2 * N)
+        refined[0::2] = y
+        refined[1::2] = _periodic_samples(lambda x: func(x + L / N), L, N)
+        N, y = 2 * N, refined
+        refined_coefficients = _coefficients_from_samples(y, terms)
+        extrapolated = tuple(2 * np.asarray(new) - old for new, old in zip(refined_coefficients, coefficients))
+        if estimate is not coefficients:
+            change = max(np.max(np.abs(np.subtract(new, old)), initial=0.0)
+                         for new, old in zip(extrapolated, estimate))
+        coefficients, estimate = refined_coefficients, extrapolated
+        if change <= tol:
+            break
+    else:
+        warnings.warn(
+            f"fft_coefficients reached max_N = {max_N} before tol = {tol:g}; "
+            f"the last refinement changed the coefficients by {change:.3g}",
+            RuntimeWarning,
+        )
+    a0, an, bn = estimate
+    return float(a0), an, bn
+
+
+def sigma_weights(terms, kind):
+    """
+    Weights w1..wK that damp the truncated series (Gibbs ringing) before synthesis.
+
+    - "lanczos": sigma factors sinc(n / (K + 1)); keeps the steepness of jumps.
+    - "fejer": 1 - n / (K + 1), the Cesaro mean of the partial sums; never overshoots.
+    """
+    n = np.arange(1, terms + 1) / (terms + 1)
+    if kind == "lanczos":
+        return np.sinc(n)
+    if kind == "fejer":
+        return 1 - n
+    raise ValueError("kind must be 'lanczos' or 'fejer'")
+
+
+# "auto" synthesis uses the FFT only while its size P = 2L / step stays within this factor
+# of the work it replaces (len(x) points, 2K + 2 spectrum bins); sparse grids use Clenshaw
+FFT_SIZE_FACTOR = 4
+
+
+def _uniform_period_divisor(x, L):
+    # P such that x is a uniform grid with step 2L / P (P integer), else None
+    if x.ndim != 1 or len(x) < 2:
+        return None
+    step = (x[-1] - x[0]) / (len(x) - 1)
+    if step <= 0:
+        return None
+    P = 2 * L / step
+    if abs(P - round(P)) > 1e-9 * P or not np.allclose(np.diff(x), step, rtol=1e-9, atol=0):
+        return None
+    return int(round(P))
+
+
+def _synthesize_fft(a0, an, bn, x, L, P):
+    # Grid x0 + k 2L/P: with theta_k = pi x0 / L + 2 pi k / P the series is the inverse real
+    # FFT of (an - i bn) / 2 * e^(i n pi x0 / L). Use Q = m P > 2K points and keep every mth.
+    terms = len(an)
+    m = -(-(2 * terms + 2) // P) if P <= 2 * terms + 1 else 1
+    Q = m * P
+    n = np.arange(1, terms + 1)
+    spectrum = np.zeros(Q // 2 + 1, dtype=complex)
+    spectrum[0] = a0 / 2
+    spectrum[1:terms + 1] = (an - 1j * bn) / 2 * np.exp(1j * np.pi * n * x[0] / L)
+    values = np.fft.irfft(spectrum * Q, n=Q)
+    return values[(np.arange(len(x)) * m) % Q]
+
+
+def _synthesize_clenshaw(a0, an, bn, x, L):
+    # Clenshaw recurrence u_n = c_n + 2 cos(theta) u_{n+1} - u_{n+2}, run on the cosine and
+    # sine coefficients together; three buffers are reused, nothing is allocated per term
+    theta = np.pi * x / L
+    two_cos = 2 * np.cos(theta)
+    shape = (2,) + theta.shape
+    u1, u2, scratch = np.zeros(shape), np.zeros(shape), np.empty(shape)
+    pairs = np.stack([an, bn], axis=1).reshape((len(an), 2) + (1,) * theta.ndim)
+    for n in range(len(an) - 1, -1, -1):
+        np.multiply(two_cos, u1, out=scratch)
+        scratch -= u2
+        scratch += pairs[n]
+        u1, u2, scratch = scratch, u1, u2
+    # sum an cos(n theta) = u1 cos(theta) - u2, sum bn sin(n theta) = u1 sin(theta)
+    return a0 / 2 + (u1[0] * (two_cos / 2) - u2[0]) + u1[1] * np.sin(theta)
+
+
+@instrument("synthesize", samples=lambda a0, an, bn, x, *args, **kwargs: len(an) * np.size(x))
+def synthesize(a0, an, bn, x, L, weights=None, method="auto"):
+    """
+    Evaluate the truncated series a0/2 + sum an cos(n pi x / L) + bn sin(n pi x / L).
+
+    Parameters:
+    - a0, an, bn: Coefficients; an[n - 1] and bn[n - 1] belong to harmonic n.
+    - x: Points at which to evaluate the series.
+    - L: Half-period.
+    - weights: None, "lanczos", "fejer" (see sigma_weights) or an array of K weights.
+    - method: "fft" needs a uniform grid whose step divides the period 2L, such as
+      np.linspace(-L, L, M); it costs O(P log P) for P = 2L / step whatever the number of
+      terms. "clenshaw" works for any x in O(K * len(x)) without per-term arrays. "auto"
+      picks "fft" when the grid allows it and P is at most FFT_SIZE_FACTOR times
+      max(len(x), 2K + 2), so a few points spread over a fine step never cost a huge FFT.
+
+    Returns:
+    - The series at x (float64).
+    """
+    x = np.asarray(x, dtype=float)
+    an = np.asarray(an, dtype=float)
+    bn = np.asarray(bn, dtype=float)
+    if weights is not None:
+        w = sigma_weights(len(an), weights) if isinstance(weights, str) else np.asarray(weights, dtype=float)
+        an, bn = an * w, bn * w
+    if method not in ("auto", "fft", "clenshaw"):
+        raise ValueError("method must be 'auto', 'fft' or 'clenshaw'")
+
+    P = _uniform_period_divisor(x, L) if method != "clenshaw" else None
+    if method == "auto" and P is not None and P > FFT_SIZE_FACTOR * max(x.size, 2 * len(an) + 2):
+        P = None
+    if P is not None:
+        return _synthesize_fft(float(a0), an, bn, x, L, P)
+    if method == "fft":
+        raise ValueError("method='fft' needs a uniform grid whose step divides 2 * L")
+    return _synthesize_clenshaw(float(a0), an, bn, x, L)
+
+
+def _harmonic_basis(L, terms, N=1000, dtype=np.float64):
+    """
+    The trapezoid rule of calculate_a0/an/bn for harmonics 0..terms as one matrix.
+
+    Returns:
+    - x: The N sample points on [-L, L] (same grid as FourierSeries._sample).
+    - basis: (N, 2 * terms + 1) matrix; samples @ basis gives [a0, a1..aK, b1..bK].
+    """
+    dtype = np.dtype(dtype)
+    x = np.linspace(-L, L, N, dtype=dtype)
+    weights = np.zeros(N, dtype=dtype)
+    steps = np.diff(x) / 2
+    weights[:-1] += steps
+    weights[1:] += steps
+    weights /= dtype.type(L)
+
+    angles = np.outer(x, np.arange(1, terms + 1, dtype=dtype) * dtype.type(np.pi / L))
+    basis = np.empty((N, 2 * terms + 1), dtype=dtype)
+    basis[:, 0] = weights
+    np.multiply(np.cos(angles), weights[:, None], out=basis[:, 1:terms + 1])
+    np.multiply(np.sin(angles), weights[:, None], out=basis[:, terms + 1:])
+    return x, basis
+
+
+def series_coefficients(funcs, L, terms, N=1000, dtype=np.float64):
+    """
+    Fourier coefficients of many functions at once: their samples stacked into one
+    (functions, N) matrix times one harmonic basis matrix.
+
+    Parameters:
+    - funcs: Sequence of target functions (all with half-period L).
+    - L, terms, N, dtype: As for FourierSeries / calculate_an.
+
+    Returns:
+    - a0: (functions,) array.
+    - an, bn: (functions, terms) arrays; column n - 1 holds harmonic n.
+    """
+    dtype = np.dtype(dtype)
+    x, basis = _harmonic_basis(L, terms, N, dtype)
+    samples = np.empty((len(funcs), N), dtype=dtype)
+    for row, func in zip(samples, funcs):
+        row[:] = func(x)
+    coefficients = samples @ basis
+    return coefficients[:, 0], coefficients[:, 1:terms + 1], coefficients[:, terms + 1:]
+
+
+def partial_sums(a0, an, bn, x, L):
+    """
+    Fourier series approximations for every term count 1..K.
+
+    Parameters:
+    - a0, an, bn: Coefficients as returned by series_coefficients ((k,), (k, K), (k, K)).
+    - x: Points at which to evaluate the series.
+    - L: Half-period.
+
+    Returns:
+    - (k, K, len(x)) array; [i, j] is the approximation of function i with j + 1 terms.
+    """
+    an, bn = np.atleast_2d(an), np.atleast_2d(bn)
+    dtype = an.dtype
+    x = np.asarray(x, dtype=dtype)
+    angles = np.outer(np.arange(1, an.shape[1] + 1, dtype=dtype) * dtype.type(np.pi / L), x)
+    sums = an[:, :, None] * np.cos(angles)
+    sums += bn[:, :, None] * np.sin(angles)
+    np.cumsum(sums, axis=1, out=sums)
+    sums += np.reshape(a0, (-1, 1, 1)) / 2
+    return sums
+
+
+def _series_chunk(funcs, L, max_terms, x, N, dtype, keep_approximations):
+    # Worker for fourier_series_batch: one chunk of functions, start to finish
+    a0, an, bn = series_coefficients(funcs, L, max_terms, N, dtype)
+    approximations = partial_sums(a0, an, bn, x, L)
+    rows = []
+    for i, func in enumerate(funcs):
+        target = np.asarray(func(x), dtype=approximations.dtype)
+        rows.append({
+            "a0": a0[i],
+            "an": an[i],
+            "bn": bn[i],
+            "rmse": np.sqrt(np.mean((approximations[i] - target) ** 2, axis=-1)),
+            "approximations": approximations[i] if keep_approximations else None,
+        })
+    return rows
+
+
+@instrument("fourier_series_batch", samples=lambda functions, L, max_terms, x, *args, **kwargs: len(functions) * max_terms * np.size(x))
+def fourier_series_batch(functions, L, max_terms, x, N=1000, max_workers=None, processes=False,
+                         keep_approximations=True, dtype=np.float64):
+    """
+    Convergence study: the Fourier series of many functions for every term count 1..max_terms.
+
+    The functions are split into one chunk per worker; each chunk is sampled, projected on
+    the harmonic basis with one matrix product and summed up with one cumulative sum.
+
+    Parameters:
+    - functions: dict of name -> target function (half-period L).
+    - L: Half-period shared by all functions.
+    - max_terms: Highest term count K.
+    - x: Points at which the approximations are evaluated and compared with the function.
+    - N: Number of points used for the coefficient integrals.
+    - max_workers: Number of chunks / pool workers (default: CPU count).
+    - processes: Use a process pool instead of threads. The functions must then be picklable
+      (module-level functions or functools.partial, not lambdas).
+    - keep_approximations: Return the (K, len(x)) approximations, not only their errors.
+      Turn off for large studies; memory is then bounded by one chunk.
+    - dtype: np.float64 or np.float32.
+
+    Returns:
+    - results: A list of rows (dicts), one per function in input order, with name, a0, an,
+      bn, rmse ((K,) error against the function at x, index j for j + 1 terms) and
+      approximations.
+    """
+    names = list(functions)
+    funcs = [functions[name] for name in names]
+    x = np.asarray(x)
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(funcs)))
+    chunks = [funcs[i::workers] for i in range(workers)]  # interleaved, so slow functions spread out
+    args = (L, max_terms, x, N, dtype, keep_approximations)
+
+    if workers == 1:
+        outputs = [_series_chunk(funcs, *args)]
+    else:
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with pool(max_workers=workers) as executor:
+            outputs = list(executor.map(_series_chunk, chunks, *[[arg] * workers for arg in args]))
+
+    results = [None] * len(names)
+    for chunk_idx, rows in enumerate(outputs):
+        for position, row in enumerate(rows):
+            index = chunk_idx + position * workers
+            results[index] = {"name": names[index], **row}
+    return results
+
+
+def target_function(x, function_type="square"):
+    if function_type == "square":
+        # return np.sign(np.sin((2 * np.pi / 6) * x))  # Square wave with 2*np.pi 6
+        return np.where(np.sin(x) >= 0, 1, -1)
+    elif function_type == "sawtooth":
+        return 2 * (x / (2 * np.pi) - np.floor(x / (2 * np.pi) + 0.5))  # Sawtooth wave
+    
+    elif function_type == "triangle":
+        return 2 * np.abs(2 * (x / (2 * np.pi) - np.floor(x / (2 * np.pi) + 0.5))) - 1  # Triangle wave
+        # return 2 * np.abs(2 * (x / 2*np.pi - np.floor(x / (2*np.pi) + 0.5)))
+
+    elif function_type == "sine":
+        return np.sin(x)  # Sine wave
+
+    elif function_type == "cosine":
+        return np.cos(x)  # Cosine wave
+
+    else:
+        raise ValueError("Invalid function_type. Choose from 'square', 'sawtooth', 'triangle', 'sine', or 'cosine'.")
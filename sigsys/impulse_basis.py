@@ -0,0 +1,53 @@
+import numpy as np
+
+
+class PulseBasis:
+    def __init__(self, starts, width, coefficients):
+        """
+        Decomposition of a signal into rectangular pulses of equal width, kept as arrays
+        instead of one signal object per pulse.
+
+        Pulse k covers [starts[k], starts[k] + width) and has area coefficients[k]
+        (height coefficients[k] / width), matching the (1 / delta) * rect pulses and
+        x(t) * delta coefficients of LTIContinuous.linear_combination_of_impulses.
+        For a DiscreteSignal the width is 1 and the pulses are the unit impulses.
+
+        Parameters:
+        - starts: Increasing start time of each pulse, at least width apart (pulses do not overlap).
+        - width: Width shared by all pulses (delta).
+        - coefficients: Area of each pulse.
+        """
+        self.starts = np.asarray(starts, dtype=float)
+        self.width = float(width)
+        self.coefficients = np.asarray(coefficients)
+        if self.starts.shape != self.coefficients.shape:
+            raise ValueError("starts and coefficients must have the same length")
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def heights(self):
+        return self.coefficients / self.width
+
+    def reconstruct(self, t_values):
+        """
+        Sum of the pulses at arbitrary times, found with a single searchsorted.
+        """
+        t_values = np.asarray(t_values, dtype=float)
+        idx = np.searchsorted(self.starts, t_values, side="right") - 1
+        safe = np.clip(idx, 0, len(self.starts) - 1)
+        inside = (idx >= 0) & (t_values < self.starts[safe] + self.width)
+        return np.where(inside, self.heights[safe], 0.0)
+
+    def staircase(self, samples_per_pulse):
+        """
+        Dense staircase with samples_per_pulse points per pulse, built with np.repeat.
+
+        Returns:
+        - t_values: Sample times.
+        - y_values: Reconstructed signal at t_values.
+        """
+        offsets = np.arange(samples_per_pulse) * (self.width / samples_per_pulse)
+        t_values = (self.starts[:, None] + offsets[None, :]).ravel()
+        return t_values, np.repeat(self.heights, samples_per_pulse)
@@ -0,0 +1,149 @@
+"""
+Named timers and counters for the signal, LTI and transform code.
+
+Off by default. Turn it on with the environment variable SIGNALS_PROFILE=1 (and
+SIGNALS_PROFILE_JSON=<file> to dump the report at exit), or around a block of code:
+
+    with profiling() as stats:
+        lti_system.response_of_input_plot(input_signal)
+    print(to_json())
+
+Each name collects calls, total time, samples processed and bytes of the arrays returned.
+Times are inclusive: LTI_Discrete.output also contains the DiscreteSignal.add calls it makes.
+When profiling is off an instrumented function costs one extra call and a flag check.
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+import numpy as np
+
+_enabled = os.environ.get("SIGNALS_PROFILE", "") not in ("", "0")
+_stats = {}
+_lock = threading.Lock()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def _nbytes(result):
+    # Size of the arrays a call hands back (an estimate of what it allocated)
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, (tuple, list)):
+        return sum(_nbytes(item) for item in result[:16])
+    values = getattr(result, "values", None)
+    return values.nbytes if isinstance(values, np.ndarray) else 0
+
+
+def count(name, calls=1, seconds=0.0, samples=0, nbytes=0):
+    """
+    Add to the counters of name (does nothing while profiling is off).
+    """
+    if not _enabled:
+        return
+    with _lock:
+        entry = _stats.get(name)
+        if entry is None:
+            entry = _stats[name] = {"calls": 0, "seconds": 0.0, "samples": 0, "bytes": 0}
+        entry["calls"] += calls
+        entry["seconds"] += seconds
+        entry["samples"] += int(samples)
+        entry["bytes"] += int(nbytes)
+
+
+def instrument(name, samples=None):
+    """
+    Decorator that times every call of the function under name.
+
+    Parameters:
+    - name: Timer name, e.g. "LTI_Discrete.output".
+    - samples: Optional function of the call's arguments returning how many samples it processes.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            result = func(*args, **kwargs)
+            elapsed = perf_counter() - start
+            count(name, 1, elapsed, samples(*args, **kwargs) if samples else 0, _nbytes(result))
+            return result
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def timer(name, samples=0):
+    """
+    Time a block of code under name (e.g. the matplotlib part of a plot).
+    """
+    if not _enabled:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        count(name, 1, perf_counter() - start, samples)
+
+
+@contextmanager
+def profiling(clear=True):
+    """
+    Enable profiling inside the with block. Yields the live stats dict.
+    """
+    global _enabled
+    previous = _enabled
+    if clear:
+        reset()
+    _enabled = True
+    try:
+        yield _stats
+    finally:
+        _enabled = previous
+
+
+def report():
+    """
+    Copy of the counters, slowest first.
+    """
+    with _lock:
+        items = sorted(_stats.items(), key=lambda item: item[1]["seconds"], reverse=True)
+        return {name: dict(entry) for name, entry in items}
+
+
+def to_json(path=None):
+    """
+    The report as a JSON string, also written to path if given.
+    """
+    text = json.dumps(report(), indent=2)
+    if path is not None:
+        with open(path, "w") as f:
+            f.write(text)
+    return text
+
+
+if os.environ.get("SIGNALS_PROFILE_JSON"):
+    atexit.register(lambda: to_json(os.environ["SIGNALS_PROFILE_JSON"]))
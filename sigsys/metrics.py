@@ -0,0 +1,66 @@
+import time
+import numpy as np
+
+
+def reconstruction_metrics(original, reconstructed):
+    """
+    Compare a signal with its reconstruction.
+
+    All the sums are taken from one Gram matrix of [x, e] (e = reconstructed - x), so the
+    input is only traversed once for the energies; max error needs its own reduction.
+
+    Parameters:
+    - original: The input signal x.
+    - reconstructed: The output of inverse_fourier_transform for x.
+
+    Returns:
+    - A dict with rmse, max_error, snr_db and energy_ratio (reconstructed / original energy).
+    """
+    original = np.asarray(original, dtype=float)
+    error = np.asarray(reconstructed, dtype=float) - original
+    stacked = np.stack([original, error])
+    gram = stacked @ stacked.T
+    signal_energy, cross, error_energy = gram[0, 0], gram[0, 1], gram[1, 1]
+    reconstructed_energy = signal_energy + 2 * cross + error_energy
+
+    n = len(original)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        snr_db = 10 * np.log10(signal_energy / error_energy) if error_energy > 0 else np.inf
+        energy_ratio = reconstructed_energy / signal_energy if signal_energy > 0 else np.nan
+
+    return {
+        "rmse": float(np.sqrt(error_energy / n)),
+        "max_error": float(np.max(np.abs(error))) if n else 0.0,
+        "snr_db": float(snr_db),
+        "energy_ratio": float(energy_ratio),
+    }
+
+
+def evaluate_transform(signal, frequencies, sampled_times, forward, inverse):
+    """
+    Run a forward/inverse transform pair on a signal and measure what was lost.
+
+    Parameters:
+    - signal: Sampled input signal.
+    - frequencies: Frequency grid for the transform.
+    - sampled_times: Time axis of the signal.
+    - forward: Forward transform, called as forward(signal, frequencies, sampled_times).
+    - inverse: Inverse transform, called as inverse(ft_signal, frequencies, sampled_times).
+
+    Returns:
+    - ft_signal: Output of the forward transform.
+    - reconstructed: Output of the inverse transform.
+    - report: reconstruction_metrics plus forward_time, inverse_time and metrics_time (seconds).
+    """
+    start = time.perf_counter()
+    ft_signal = forward(signal, frequencies, sampled_times)
+    forward_done = time.perf_counter()
+    reconstructed = inverse(ft_signal, frequencies, sampled_times)
+    inverse_done = time.perf_counter()
+    report = reconstruction_metrics(signal, reconstructed)
+    metrics_done = time.perf_counter()
+
+    report["forward_time"] = forward_done - start
+    report["inverse_time"] = inverse_done - forward_done
+    report["metrics_time"] = metrics_done - inverse_done
+    return ft_signal, reconstructed, report
@@ -0,0 +1,188 @@
+import functools
+import os
+from collections import OrderedDict
+
+from .instrumentation import timer
+from .storage import KINDS, content_hash
+
+
+def file_fingerprint(path):
+    """
+    (size, modification time) of a file; pass it as a parameter of the stage that reads the
+    file so editing the file invalidates that stage and everything after it.
+    """
+    info = os.stat(path)
+    return [info.st_size, info.st_mtime_ns]
+
+
+def _code_id(code):
+    # Bytecode, names and constants of a code object, nested functions included
+    return [
+        code.co_code.hex(),
+        list(code.co_names),
+        [_code_id(const) if hasattr(const, "co_code") else repr(const) for const in code.co_consts],
+    ]
+
+
+def _value_id(value, seen):
+    # Defaults, closure cells and partial arguments: functions by their code, everything
+    # else as is (content_hash rejects values it cannot hash)
+    if callable(value) and (isinstance(value, functools.partial) or hasattr(value, "__code__")):
+        return function_id(value, seen)
+    return value
+
+
+def function_id(func, _seen=None):
+    """
+    Hashable description of what a stage function does: its bytecode and constants
+    (recursively for nested functions and lambdas), its default arguments and the values
+    captured by its closure, so editing the body or changing a default or captured value
+    changes the key, while renaming the module it lives in, or running it as __main__, does
+    not. For a functools.partial the bound arguments are part of it. Defaults and captured
+    values must be values content_hash accepts (or functions); otherwise the key raises
+    TypeError. Globals, the functions it calls and the instance of a bound method are not
+    followed; pass a version parameter to invalidate a stage on changes there. Callables
+    without bytecode (builtins, ufuncs) are identified by their qualified name.
+    """
+    seen = set() if _seen is None else _seen
+    if id(func) in seen:
+        return ["recursive"]  # a nested function that refers to itself
+    seen.add(id(func))
+    if isinstance(func, functools.partial):
+        return [
+            "partial",
+            function_id(func.func, seen),
+            [_value_id(arg, seen) for arg in func.args],
+            {key: _value_id(value, seen) for key, value in func.keywords.items()},
+        ]
+    func = getattr(func, "__func__", func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return ["name", getattr(func, "__qualname__", type(func).__qualname__)]
+    cells = []
+    for cell in func.__closure__ or ():
+        try:
+            cells.append(_value_id(cell.cell_contents, seen))
+        except ValueError:  # cell not filled yet
+            cells.append(["empty"])
+    return [
+        "code",
+        _code_id(code),
+        [_value_id(value, seen) for value in func.__defaults__ or ()],
+        {key: _value_id(value, seen) for key, value in (func.__kwdefaults__ or {}).items()},
+        cells,
+    ]
+
+
+class Node:
+    __slots__ = ("name", "func", "inputs", "params", "persist", "runtime")
+
+    def __init__(self, name, func, inputs=(), params=None, persist=False, runtime=None):
+        """
+        One pipeline stage: func(*values of inputs, **params).
+
+        Parameters:
+        - name: Unique stage name.
+        - func: The stage. It must not modify its input values in place (they are cached);
+          e.g. copy a Spectrum before Spectrum.high_pass.
+        - inputs: Names of the stages whose outputs are passed positionally.
+        - params: Keyword arguments; numbers, strings, arrays and lists/dicts of those.
+        - persist: Also keep the output in the pipeline's Store (when it has one and the
+          output is a type sigsys.storage can save), so it survives between runs.
+        - runtime: Keyword arguments that do not change the output (e.g. a worker count);
+          passed to func but left out of the key.
+        """
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.params = dict(params or {})
+        self.persist = persist
+        self.runtime = dict(runtime or {})
+
+
+class Pipeline:
+    def __init__(self, store=None, cache_size=32):
+        """
+        A DAG of stages with content-addressed outputs.
+
+        The key of a stage is a hash of its name, its function's code (see function_id), its
+        parameters and the keys of its inputs, so changing one parameter changes the keys of
+        that stage and of the stages after it only; every other output is taken from the
+        cache. Outputs are kept in memory (the last cache_size of them) and, for stages
+        marked persist, in store.
+
+        Parameters:
+        - store: Optional sigsys.storage.Store for persisted stages.
+        - cache_size: Number of outputs kept in memory.
+        """
+        self.nodes = {}
+        self.store = store
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.computed = []  # stages actually run by the last run() call
+
+    def add(self, name, func, inputs=(), persist=False, runtime=None, **params):
+        if name in self.nodes:
+            raise ValueError(f"stage {name!r} already exists")
+        for dependency in inputs:
+            if dependency not in self.nodes:
+                raise ValueError(f"stage {name!r} depends on unknown stage {dependency!r}")
+        self.nodes[name] = Node(name, func, inputs, params, persist, runtime)
+        return name
+
+    def set(self, name, **params):
+        """
+        Change parameters of a stage; the next run() recomputes it and what depends on it.
+        """
+        self.nodes[name].params.update(params)
+
+    def key(self, name, _keys=None):
+        keys = {} if _keys is None else _keys
+        if name not in keys:
+            node = self.nodes[name]
+            inputs = [self.key(dependency, keys) for dependency in node.inputs]
+            try:
+                keys[name] = content_hash(node.name, function_id(node.func), node.params, inputs)
+            except TypeError as error:
+                raise TypeError(f"stage {name!r} cannot be keyed: {error}") from None
+        return keys[name]
+
+    def run(self, name, **params):
+        """
+        Output of stage name, computing only the stages whose key is not cached.
+        Keyword arguments are applied with set() first.
+        """
+        if params:
+            self.set(name, **params)
+        self.computed = []
+        return self._value(name, {})
+
+    def _value(self, name, keys):
+        key = self.key(name, keys)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        node = self.nodes[name]
+        if node.persist and self.store is not None and key in self.store:
+            value = self.store.get(key)
+        else:
+            args = [self._value(dependency, keys) for dependency in node.inputs]
+            with timer(f"pipeline.{name}"):
+                value = node.func(*args, **node.params, **node.runtime)
+            self.computed.append(name)
+            if node.persist and self.store is not None and self._saveable(value):
+                self.store.put(value, key)
+
+        self._cache[key] = value
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _saveable(value):
+        return isinstance(value, tuple(cls for cls, _, _ in KINDS.values()))
+
+    def clear_cache(self):
+        self._cache.clear()
+
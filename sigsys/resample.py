@@ -0,0 +1,108 @@
+from math import gcd
+
+import numpy as np
+
+from .fir import lowpass_taps
+from .instrumentation import instrument
+
+
+class Resampler:
+    __slots__ = ("up", "down", "taps", "_phases", "_history", "_consumed", "_next")
+
+    def __init__(self, up, down, half_length=10, beta=5.0):
+        """
+        Rational resampler: the rate changes by up / down, with an anti-aliasing low-pass.
+
+        Conceptually the input is upsampled by inserting up - 1 zeros between samples,
+        low-pass filtered at min(input, output) Nyquist and every down-th sample kept. The
+        filter is split into up polyphase branches, so only the products that end up in
+        the output are computed: about len(taps) / up per output sample.
+
+        Parameters:
+        - up, down: Positive integers (reduced by their gcd).
+        - half_length: Filter half-length in input/output periods (taps = 2 * half_length *
+          max(up, down) + 1); longer filters give a sharper band edge.
+        - beta: Kaiser window shape of the filter.
+
+        resample() handles a whole array (delay compensated, like scipy.signal.resample_poly);
+        process() handles a stream block by block, delayed by `delay` input samples.
+        """
+        if up < 1 or down < 1:
+            raise ValueError("up and down must be positive integers")
+        common = gcd(int(up), int(down))
+        self.up, self.down = int(up) // common, int(down) // common
+        if self.up == self.down == 1:
+            self.taps = np.ones(1)
+        else:
+            num_taps = 2 * half_length * max(self.up, self.down) + 1
+            self.taps = self.up * lowpass_taps(0.5 / max(self.up, self.down), 1.0, num_taps, beta)
+        # _phases[p, q] = taps[p + q * up]: branch p weights x[n // up - q] for output index n
+        per_phase = -(-len(self.taps) // self.up)
+        padded = np.zeros(per_phase * self.up)
+        padded[:len(self.taps)] = self.taps
+        self._phases = padded.reshape(per_phase, self.up).T.copy()
+        self.reset()
+
+    @property
+    def delay(self):
+        # Filter delay of process() output, in input samples
+        return (len(self.taps) - 1) / 2 / self.up
+
+    def reset(self):
+        self._history = np.zeros(self._phases.shape[1] - 1)
+        self._consumed = 0  # input samples seen so far
+        self._next = 0  # upsampled-rate index of the next output sample
+
+    def _filter(self, buffer, buffer_start, n):
+        # Output samples at upsampled indices n; buffer holds input samples from index
+        # buffer_start on, and reaches back at least len(_phases[0]) - 1 before each n // up
+        base = n // self.up - buffer_start
+        phases = self._phases[n % self.up]
+        out = np.zeros(len(n), dtype=np.result_type(buffer.dtype, float))
+        for q in range(phases.shape[1]):
+            out += phases[:, q] * buffer[base - q]
+        return out
+
+    @instrument("Resampler.resample", samples=lambda self, x: len(x))
+    def resample(self, x):
+        """
+        Resample a whole signal; returns ceil(len(x) * up / down) samples aligned with x
+        (the filter delay is compensated). Does not touch the streaming state.
+        """
+        x = np.asarray(x)
+        num_out = -(-len(x) * self.up // self.down)
+        delay = (len(self.taps) - 1) // 2
+        span = self._phases.shape[1]
+        buffer = np.concatenate((np.zeros(span - 1), x, np.zeros(delay // self.up + 1)))
+        n = delay + np.arange(num_out) * self.down
+        return self._filter(buffer, -(span - 1), n).astype(np.result_type(x.dtype, np.float32), copy=False)
+
+    @instrument("Resampler.process", samples=lambda self, block: len(block))
+    def process(self, block):
+        """
+        Resample the next block of a stream. Returns every output sample whose inputs have
+        arrived (the count varies by at most one from len(block) * up / down).
+        """
+        block = np.asarray(block, dtype=float)
+        buffer = np.concatenate((self._history, block))
+        buffer_start = self._consumed - len(self._history)
+        self._consumed += len(block)
+        last = self._consumed * self.up - 1  # highest upsampled index covered by the input
+        count = max(0, (last - self._next) // self.down + 1)
+        n = self._next + np.arange(count) * self.down
+        self._next += count * self.down
+        if len(self._history):
+            self._history = buffer[-len(self._history):].copy()
+        return self._filter(buffer, buffer_start, n)
+
+    def skip(self, block):
+        # Same state update as process() (for dropped stream frames)
+        self.process(block)
+
+
+def resample(x, up, down, half_length=10, beta=5.0):
+    """
+    x resampled by up / down with an anti-aliasing filter; the filtered replacement for
+    x[::down] (up = 1).
+    """
+    return Resampler(up, down, half_length, beta).resample(x)
@@ -0,0 +1,92 @@
+import numpy as np
+
+from .continuous import ContinuousSignal
+
+
+class SampledSignal(ContinuousSignal):
+    __slots__ = ("t_grid", "samples", "kind", "_spline")
+
+    def __init__(self, t_grid, samples, INF, kind="linear"):
+        """
+        A ContinuousSignal backed by samples on a time grid instead of a Python closure.
+
+        func interpolates the samples for any array of times in one vectorized call and is
+        0 outside the grid.
+
+        Parameters:
+        - t_grid: Increasing sample times.
+        - samples: Signal values at t_grid.
+        - INF: Same meaning as for ContinuousSignal.
+        - kind: "linear", "cubic" (needs SciPy) or "sinc" (band-limited, needs a uniform grid).
+        """
+        self.t_grid = np.asarray(t_grid, dtype=float)
+        self.samples = np.asarray(samples, dtype=float)
+        if self.t_grid.shape != self.samples.shape or self.t_grid.ndim != 1:
+            raise ValueError("t_grid and samples must be 1-D arrays of the same length")
+        if kind not in ("linear", "cubic", "sinc"):
+            raise ValueError("kind must be 'linear', 'cubic' or 'sinc'")
+        self.kind = kind
+        self._spline = None
+        super().__init__(self._interpolate, INF)
+
+    @classmethod
+    def from_signal(cls, signal, num_points=5000, kind="linear", t_grid=None):
+        """
+        Sample a callable ContinuousSignal once (on np.linspace(-INF, INF, num_points) unless
+        t_grid is given).
+        """
+        if t_grid is None:
+            t_grid = np.linspace(-signal.INF, signal.INF, num_points)
+        t_grid = np.asarray(t_grid, dtype=float)
+        samples = np.zeros(t_grid.shape) + signal.func(t_grid)
+        return cls(t_grid, samples, signal.INF, kind)
+
+    def to_continuous(self):
+        """
+        Plain ContinuousSignal whose func is this signal's interpolant.
+        """
+        return ContinuousSignal(self._interpolate, self.INF)
+
+    def _interpolate(self, t):
+        t = np.asarray(t, dtype=float)
+        if self.kind == "linear":
+            return np.interp(t, self.t_grid, self.samples, left=0.0, right=0.0)
+        if self.kind == "cubic":
+            if self._spline is None:
+                from scipy.interpolate import CubicSpline
+                self._spline = CubicSpline(self.t_grid, self.samples, extrapolate=False)
+            return np.nan_to_num(self._spline(t), nan=0.0)
+        return self._sinc_interpolate(t)
+
+    def _sinc_interpolate(self, t, block=4096):
+        # Whittaker-Shannon: sum of samples[n] * sinc((t - t_n) / T), evaluated a block of
+        # output times at a time to bound the size of the (block x N) kernel matrix
+        step = np.diff(self.t_grid)
+        if not np.allclose(step, step[0]):
+            raise ValueError("sinc interpolation needs a uniform t_grid")
+        T = step[0]
+        flat = t.ravel()
+        result = np.empty(flat.shape)
+        for start in range(0, flat.size, block):
+            chunk = flat[start:start + block]
+            kernel = np.sinc((chunk[:, None] - self.t_grid[None, :]) / T)
+            result[start:start + block] = kernel @ self.samples
+        inside = (flat >= self.t_grid[0]) & (flat <= self.t_grid[-1])
+        return np.where(inside, result, 0.0).reshape(t.shape)
+
+    def shift(self, shift):
+        # Shifting moves the grid; the samples are reused as they are
+        return SampledSignal(self.t_grid + shift, self.samples, self.INF, self.kind)
+
+    def add(self, other):
+        if isinstance(other, SampledSignal) and np.array_equal(self.t_grid, other.t_grid):
+            return SampledSignal(self.t_grid, self.samples + other.samples, self.INF, self.kind)
+        return super().add(other)
+
+    def multiply(self, other):
+        if isinstance(other, SampledSignal) and np.array_equal(self.t_grid, other.t_grid):
+            return SampledSignal(self.t_grid, self.samples * other.samples, self.INF, self.kind)
+        return super().multiply(other)
+
+    def multiply_const_factor(self, scaler):
+        return SampledSignal(self.t_grid, self.samples * scaler, self.INF, self.kind)
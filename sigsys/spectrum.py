@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class Spectrum:
+    def __init__(self, values, frequencies):
+        """
+        Fourier transform of a signal: one contiguous complex buffer and its frequency axis.
+
+        Parameters:
+        - values: Complex transform values, one per frequency.
+        - frequencies: Frequencies (Hz) the values were computed at.
+        """
+        self.values = np.ascontiguousarray(values)
+        if self.values.dtype.kind != "c":
+            self.values = self.values.astype(np.result_type(self.values.dtype, np.complex64))
+        self.frequencies = np.asarray(frequencies)
+        if self.values.shape != self.frequencies.shape:
+            raise ValueError("values and frequencies must have the same shape")
+
+    @classmethod
+    def from_parts(cls, real_part, imag_part, frequencies):
+        """
+        Build a Spectrum from the old (real_part, imag_part) pair.
+        """
+        real_part = np.asarray(real_part)
+        values = np.empty(real_part.shape, dtype=np.result_type(real_part.dtype, np.complex64))
+        values.real = real_part
+        values.imag = imag_part
+        return cls(values, frequencies)
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def real(self):
+        # View into the complex buffer, no copy
+        return self.values.real
+
+    @property
+    def imag(self):
+        return self.values.imag
+
+    def magnitude(self, out=None):
+        """
+        |X(f)|. Pass out to reuse a buffer across calls.
+        """
+        return np.abs(self.values, out=out)
+
+    def phase(self, out=None):
+        return np.angle(self.values) if out is None else np.arctan2(self.imag, self.real, out=out)
+
+    def copy(self):
+        return Spectrum(self.values.copy(), self.frequencies)
+
+    def apply_mask(self, mask):
+        """
+        Zero every value where mask is False, in place.
+        """
+        self.values[~np.asarray(mask, dtype=bool)] = 0
+        return self
+
+    def apply_filter(self, response):
+        """
+        Multiply by a frequency response H(f) in place.
+        """
+        self.values *= response
+        return self
+
+    def high_pass(self, cutoff):
+        # Keep |f| >= cutoff
+        return self.apply_mask(np.abs(self.frequencies) >= cutoff)
+
+    def low_pass(self, cutoff):
+        # Keep |f| <= cutoff
+        return self.apply_mask(np.abs(self.frequencies) <= cutoff)
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from .discrete import DiscreteSignal
+from .sampled import SampledSignal
+from .spectrum import Spectrum
+from .fourier_series import FourierCoefficients
+
+# On disk a saved object is a directory: meta.json (kind, scalar fields, content hash) and
+# one .npy file per array, so large arrays can be memory-mapped instead of read.
+META_FILE = "meta.json"
+FORMAT_VERSION = 1
+
+
+def _discrete_parts(signal):
+    return {"values": signal.values}, {"INF": int(signal.INF)}
+
+
+def _discrete_build(arrays, meta):
+    return DiscreteSignal._from_values(meta["INF"], arrays["values"])
+
+
+def _sampled_parts(signal):
+    return {"t_grid": signal.t_grid, "samples": signal.samples}, {"INF": signal.INF, "kind": signal.kind}
+
+
+def _sampled_build(arrays, meta):
+    return SampledSignal(arrays["t_grid"], arrays["samples"], meta["INF"], meta["kind"])
+
+
+def _spectrum_parts(spectrum):
+    return {"values": spectrum.values, "frequencies": spectrum.frequencies}, {}
+
+
+def _spectrum_build(arrays, meta):
+    return Spectrum(arrays["values"], arrays["frequencies"])
+
+
+def _coefficients_parts(coefficients):
+    return {"an": coefficients.an, "bn": coefficients.bn}, {"a0": coefficients.a0, "L": coefficients.L}
+
+
+def _coefficients_build(arrays, meta):
+    return FourierCoefficients(meta["a0"], arrays["an"], arrays["bn"], meta["L"])
+
+
+# kind -> (class, split into (arrays, meta), rebuild from (arrays, meta))
+KINDS = {
+    "DiscreteSignal": (DiscreteSignal, _discrete_parts, _discrete_build),
+    "SampledSignal": (SampledSignal, _sampled_parts, _sampled_build),
+    "Spectrum": (Spectrum, _spectrum_parts, _spectrum_build),
+    "FourierCoefficients": (FourierCoefficients, _coefficients_parts, _coefficients_build),
+}
+
+
+def _kind_of(obj):
+    for kind, (cls, _, _) in KINDS.items():
+        if type(obj) is cls:
+            return kind
+    if isinstance(obj, SampledSignal):
+        return "SampledSignal"
+    raise TypeError(
+        f"cannot save {type(obj).__name__}; supported: {', '.join(KINDS)} "
+        "(sample a ContinuousSignal with SampledSignal.from_signal first)"
+    )
+
+
+def content_hash(*parts):
+    """
+    SHA-256 hex digest of arrays and plain values (numbers, strings, None, lists/tuples and
+    dicts of those). Arrays are hashed by dtype, shape and bytes, so equal data gives equal
+    keys across runs and processes; use it to key a stage by its inputs and parameters.
+    """
+    digest = hashlib.sha256()
+
+    def feed(part):
+        if isinstance(part, np.ndarray):
+            array = np.ascontiguousarray(part)
+            digest.update(f"array:{array.dtype.str}:{array.shape}:".encode())
+            digest.update(array.view(np.uint8).reshape(-1) if array.size else b"")
+        elif isinstance(part, (list, tuple)):
+            digest.update(f"seq:{len(part)}:".encode())
+            for item in part:
+                feed(item)
+        elif isinstance(part, dict):
+            digest.update(f"dict:{len(part)}:".encode())
+            for key in sorted(part):
+                feed(str(key))
+                feed(part[key])
+        elif isinstance(part, (np.generic, float, int, bool, str, type(None))):
+            value = part.item() if isinstance(part, np.generic) else part
+            digest.update(f"{type(value).__name__}:{value!r};".encode())
+        else:
+            raise TypeError(f"cannot hash {type(part).__name__}")
+
+    for part in parts:
+        feed(part)
+    return digest.hexdigest()
+
+
+def object_hash(obj):
+    """
+    Content hash of a saveable object (its kind, scalar fields and arrays).
+    """
+    kind = _kind_of(obj)
+    arrays, meta = KINDS[kind][1](obj)
+    return content_hash(kind, meta, arrays)
+
+
+def save(obj, path):
+    """
+    Save a DiscreteSignal, SampledSignal, Spectrum or FourierCoefficients to the directory
+    path (replaced if it exists).
+
+    Returns:
+    - The content hash of obj (also stored in meta.json).
+    """
+    kind = _kind_of(obj)
+    arrays, meta = KINDS[kind][1](obj)
+    key = content_hash(kind, meta, arrays)
+
+    path = os.path.abspath(path)
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    # Written next to the target and moved into place, so readers never see half a save
+    staging = tempfile.mkdtemp(dir=parent, prefix=".saving-")
+    try:
+        for name, array in arrays.items():
+            np.save(os.path.join(staging, f"{name}.npy"), np.asarray(array), allow_pickle=False)
+        with open(os.path.join(staging, META_FILE), "w") as f:
+            json.dump({"format": FORMAT_VERSION, "kind": kind, "hash": key,
+                       "arrays": sorted(arrays), "meta": meta}, f, indent=2)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.replace(staging, path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return key
+
+
+def read_meta(path):
+    with open(os.path.join(path, META_FILE)) as f:
+        return json.load(f)
+
+
+def load(path, mmap_mode=None):
+    """
+    Load an object written by save().
+
+    Parameters:
+    - path: Directory written by save().
+    - mmap_mode: None reads the arrays into memory; "r" maps them read-only, "c" maps them
+      copy-on-write (in-place operations such as Spectrum.high_pass work but never touch
+      the file). See numpy.load.
+    """
+    info = read_meta(path)
+    if info.get("format") != FORMAT_VERSION or info.get("kind") not in KINDS:
+        raise ValueError(f"{path} is not a saved sigsys object")
+    arrays = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode, allow_pickle=False)
+        for name in info["arrays"]
+    }
+    return KINDS[info["kind"]][2](arrays, info["meta"])
+
+
+class Store:
+    def __init__(self, root):
+        """
+        A directory of saved objects keyed by content hash (or by any key the caller
+        derives, e.g. content_hash(inputs, parameters) of the stage that produced it).
+        """
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.root, key)
+
+    def __contains__(self, key):
+        return os.path.isfile(os.path.join(self.path(key), META_FILE))
+
+    def put(self, obj, key=None):
+        """
+        Save obj under key (default: its content hash) unless that key is already present.
+
+        Returns:
+        - The key.
+        """
+        key = object_hash(obj) if key is None else key
+        if key not in self:
+            save(obj, self.path(key))
+        return key
+
+    def get(self, key, mmap_mode="r"):
+        """
+        Load the object stored under key (memory-mapped read-only by default).
+        Raises KeyError if it is not in the store.
+        """
+        if key not in self:
+            raise KeyError(key)
+        return load(self.path(key), mmap_mode)
@@ -0,0 +1,188 @@
+"""
+Filter audio as it arrives: an asyncio loop that reads fixed-size frames from an async
+source, runs them through a stateful block filter and hands them to an async sink.
+
+    stats = asyncio.run(run_stream(replay_source(data, 512, sample_rate), sink,
+                                   StreamingHighPass(sample_rate, 1000), sample_rate, 512))
+    print(stats.summary())
+
+Reading and filtering are separate tasks joined by a bounded queue, so a slow filter or
+sink shows up as queueing latency instead of stalling the source.
+"""
+import asyncio
+from time import perf_counter
+
+import numpy as np
+
+from .fir import FIRStream, highpass_taps
+
+
+class StreamingHighPass(FIRStream):
+    __slots__ = ()
+
+    def __init__(self, sample_rate, cutoff, num_taps=255, dtype=np.float64):
+        """
+        Block-by-block version of the task2 high-pass (Spectrum.high_pass keeps |f| >= cutoff).
+        The brick-wall mask becomes a linear-phase FIR filter, which adds (num_taps - 1) / 2
+        samples of delay; that delay is reported in StreamStats as the filter delay.
+        """
+        super().__init__(highpass_taps(cutoff, sample_rate, num_taps), dtype)
+
+
+class StreamStats:
+    def __init__(self, sample_rate, frame_size, latency_budget, filter_delay=0.0):
+        self.sample_rate = sample_rate
+        self.frame_size = frame_size
+        self.latency_budget = latency_budget
+        self.filter_delay = filter_delay  # seconds of delay added by the filter itself
+        self.latencies = []  # per delivered frame: read from the source -> accepted by the sink
+        self.frames = 0
+        self.dropped = 0  # frames replaced by silence because they were already over budget
+        self.underruns = 0  # frames that reached the sink after their playback deadline
+
+    @property
+    def frame_duration(self):
+        return self.frame_size / self.sample_rate
+
+    @property
+    def fixed_delay(self):
+        # Delay every sample has before any processing: waiting for its frame to fill, plus
+        # the filter's group delay
+        return self.frame_duration + self.filter_delay
+
+    @property
+    def processing_budget(self):
+        # What is left of latency_budget for queueing, filtering and the sink
+        return self.latency_budget - self.fixed_delay
+
+    def summary(self):
+        latencies = np.asarray(self.latencies) if self.latencies else np.zeros(1)
+        return {
+            "frames": self.frames,
+            "delivered": len(self.latencies),
+            "dropped": self.dropped,
+            "underruns": self.underruns,
+            "latency_mean": float(latencies.mean()),
+            "latency_p95": float(np.percentile(latencies, 95)),
+            "latency_max": float(latencies.max()),
+            "filter_delay": self.filter_delay,
+            "fixed_delay": self.fixed_delay,
+            "end_to_end_max": float(latencies.max()) + self.fixed_delay,
+            "latency_budget": self.latency_budget,
+        }
+
+
+async def replay_source(data, frame_size, sample_rate, realtime=True):
+    """
+    Stand-in for a live input: yields data in frames of frame_size samples (the last one
+    may be shorter), paced at the sample rate when realtime is True.
+    """
+    frame_duration = frame_size / sample_rate
+    start = perf_counter()
+    for index, position in enumerate(range(0, len(data), frame_size)):
+        if realtime:
+            # A frame is available once all of its samples have been "recorded"
+            await asyncio.sleep(max(0.0, start + (index + 1) * frame_duration - perf_counter()))
+        yield data[position:position + frame_size]
+
+
+async def generator_source(func, sample_rate, frame_size, duration, realtime=True):
+    """
+    Stand-in for a live input: func(t) sampled at sample_rate for duration seconds.
+    """
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    async for frame in replay_source(np.asarray(func(t), dtype=float), frame_size, sample_rate, realtime):
+        yield frame
+
+
+class CollectSink:
+    def __init__(self):
+        """
+        Async sink that keeps every frame it receives; to_array() joins them.
+        """
+        self.frames = []
+
+    async def __call__(self, frame):
+        self.frames.append(frame)
+
+    def to_array(self):
+        return np.concatenate(self.frames) if self.frames else np.zeros(0)
+
+
+async def run_stream(source, sink, processor, sample_rate, frame_size, latency_budget=0.05,
+                     queue_size=8, drop_late=True):
+    """
+    Read frames from source, filter them and push them to sink until the source ends.
+
+    Parameters:
+    - source: Async iterable of frames (1-D arrays of frame_size samples).
+    - sink: Async callable taking one filtered frame.
+    - processor: Stateful block filter with process(frame) and skip(frame), e.g.
+      StreamingHighPass.
+    - sample_rate, frame_size: Rate of the stream and samples per frame.
+    - latency_budget: Allowed end-to-end delay (s) of a sample, from when it is recorded
+      to when it is played. The frame duration and the filter delay are spent before any
+      processing, so a budget below them raises ValueError; the rest is the time a frame
+      may take from being read to being handed to the sink. Playback of each frame is
+      scheduled so that its samples play latency_budget after they were recorded; a frame
+      delivered after its slot counts as an underrun.
+    - queue_size: Frames that may wait between the reader and the filter.
+    - drop_late: Replace frames that are already over budget when the filter gets to them
+      with silence of the same length (their samples still update the filter state), so
+      the stream catches up instead of falling further behind and the output stays
+      aligned with the input.
+
+    Returns:
+    - StreamStats with per-frame latencies, drops and underruns.
+    """
+    stats = StreamStats(sample_rate, frame_size, latency_budget,
+                        getattr(processor, "delay", 0.0) / sample_rate)
+    if stats.processing_budget < 0:
+        raise ValueError(
+            f"latency_budget {latency_budget * 1e3:g} ms is below the fixed delay "
+            f"{stats.fixed_delay * 1e3:.3g} ms (frame {stats.frame_duration * 1e3:.3g} ms + "
+            f"filter {stats.filter_delay * 1e3:.3g} ms); use smaller frames or a shorter filter"
+        )
+    queue = asyncio.Queue(maxsize=queue_size)
+
+    async def read():
+        try:
+            async for frame in source:
+                await queue.put((perf_counter(), frame))
+        except Exception as error:
+            await queue.put(error)  # re-raised by the filter task
+            return
+        await queue.put(None)
+
+    async def process():
+        playback_start = None
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            arrival, frame = item
+            index = stats.frames
+            stats.frames += 1
+            if playback_start is None:
+                playback_start = arrival + stats.processing_budget
+            if drop_late and perf_counter() - arrival > stats.processing_budget:
+                processor.skip(frame)
+                stats.dropped += 1
+                stats.underruns += 1
+                await sink(np.zeros(len(frame)))
+                continue
+            await sink(processor.process(frame))
+            done = perf_counter()
+            stats.latencies.append(done - arrival)
+            if done > playback_start + index * stats.frame_duration:
+                stats.underruns += 1
+
+    reader = asyncio.ensure_future(read())
+    try:
+        await process()
+    finally:
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+    return stats
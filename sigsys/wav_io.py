@@ -0,0 +1,89 @@
+import numpy as np
+
+
+class MappedWav:
+    def __init__(self, path, chunk_size=1 << 16):
+        """
+        Memory-map the sample data of a WAV file instead of reading it into RAM. Containers
+        NumPy cannot map (24-bit PCM, 3 bytes per sample) are read into memory instead.
+
+        Parameters:
+        - path: Path to the WAV file (PCM or float samples).
+        - chunk_size: Number of frames handled per block when scanning or converting.
+        """
+        import scipy.io.wavfile as wavfile
+
+        self.path = path
+        self.chunk_size = chunk_size
+        try:
+            self.sample_rate, self.raw = wavfile.read(path, mmap=True)
+        except ValueError:
+            # e.g. "mmap=True not compatible with 3-byte container size"
+            self.sample_rate, self.raw = wavfile.read(path)
+        self._peak = None
+
+    @property
+    def num_frames(self):
+        return self.raw.shape[0]
+
+    @property
+    def num_channels(self):
+        return 1 if self.raw.ndim == 1 else self.raw.shape[1]
+
+    def peak(self):
+        """
+        Largest absolute sample over all channels, found with a chunked pass over the map.
+        """
+        if self._peak is None:
+            peak = 0
+            for start in range(0, self.num_frames, self.chunk_size):
+                block = self.raw[start:start + self.chunk_size]
+                if block.dtype.kind in "iu":
+                    # Widen so that abs(-32768) does not overflow int16
+                    block = block.astype(np.int64)
+                peak = max(peak, np.max(np.abs(block)) if block.size else 0)
+            self._peak = float(peak)
+        return self._peak
+
+    def blocks(self, step=1, dtype=np.float32):
+        """
+        Yield normalized mono blocks. Normalization and channel downmix happen together on
+        each block, so only one block is ever converted to floating point at a time.
+
+        Parameters:
+        - step: Keep every step-th frame (same as data[::step]).
+        - dtype: Floating point type of the yielded blocks.
+        """
+        scale = dtype(1.0 / self.peak()) if self.peak() > 0 else dtype(1.0)
+        # Align block starts to step so that concatenated blocks equal data[::step]
+        span = max(self.chunk_size // step, 1) * step
+        for start in range(0, self.num_frames, span):
+            block = self.raw[start:start + span:step].astype(dtype)
+            if block.ndim > 1:
+                block = block.mean(axis=1, dtype=dtype)
+            block *= scale
+            yield block
+
+    def to_array(self, step=1, dtype=np.float32):
+        """
+        Convert the whole file (or every step-th frame) to one normalized mono array,
+        filled block by block into a single preallocated output.
+        """
+        out = np.empty(len(range(0, self.num_frames, step)), dtype=dtype)
+        pos = 0
+        for block in self.blocks(step, dtype):
+            out[pos:pos + len(block)] = block
+            pos += len(block)
+        return out
+
+
+def load_normalized_mono(path, step=1, dtype=np.float32, chunk_size=1 << 16):
+    """
+    Read a WAV file as a mono signal normalized to -1..1.
+
+    Returns:
+    - sample_rate: Sampling rate of the file.
+    - data: Normalized mono samples (every step-th frame) as dtype.
+    """
+    wav = MappedWav(path, chunk_size)
+    return wav.sample_rate, wav.to_array(step, dtype)
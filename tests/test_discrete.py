@@ -0,0 +1,50 @@
+"""
+DTFT of discrete signals: the FFT and direct-sum routes against the defining sum. Series
+and parallel LTI_Discrete compositions against running the systems in turn.
+"""
+import numpy as np
+
+from sigsys.discrete import DiscreteSignal, LTI_Discrete
+
+
+def _signal(INF=300):
+    signal = DiscreteSignal(INF)
+    signal.values[:] = np.random.default_rng(0).standard_normal(2 * INF + 1)
+    return signal
+
+
+def _direct_dtft(signal, omega):
+    return np.exp(-1j * np.outer(omega, signal.time_indices)) @ signal.values
+
+
+def test_dtft_on_dft_bins():
+    signal = _signal()
+    spectrum = signal.dtft()
+    assert np.max(np.abs(spectrum.values - _direct_dtft(signal, spectrum.frequencies))) < 1e-9
+
+
+def test_dtft_off_bins_in_tiles():
+    signal = _signal()
+    omega = np.linspace(-3, 3, 5001)
+    assert np.max(np.abs(signal.dtft(omega).values - _direct_dtft(signal, omega))) < 1e-9
+
+
+def test_dtft_sparse_bins_skip_the_fft():
+    # On the 1e7-point DFT grid, but only 4 frequencies: summed directly
+    signal = _signal()
+    omega = 2 * np.pi * np.arange(4) / 1e7
+    assert np.max(np.abs(signal.dtft(omega).values - _direct_dtft(signal, omega))) < 1e-9
+
+
+def test_series_matches_systems_in_turn():
+    first, second = LTI_Discrete(_signal(50)), LTI_Discrete(_signal(50).shift_signal(3))
+    signal = _signal(50)
+    expected = second.output(first.output(signal)[0])[0].values
+    assert np.max(np.abs(first.series(second).output(signal)[0].values - expected)) < 1e-9
+
+
+def test_parallel_adds_outputs():
+    first, second = LTI_Discrete(_signal(50)), LTI_Discrete(_signal(50).shift_signal(3))
+    signal = _signal(50)
+    expected = first.output(signal)[0].values + second.output(signal)[0].values
+    assert np.max(np.abs(first.parallel(second).output(signal)[0].values - expected)) < 1e-9
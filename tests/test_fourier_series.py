@@ -0,0 +1,61 @@
+"""
+FFT coefficients: agreement with the closed form, and the warning when max_N stops the
+refinement before tol. Synthesis: the FFT and Clenshaw paths agree, and "auto" avoids an
+FFT much larger than the grid.
+"""
+import warnings
+
+import numpy as np
+import pytest
+
+import sigsys.fourier_series as fourier_series
+from sigsys.fourier_series import fft_coefficients, synthesize, target_function
+
+
+def _square(t):
+    return target_function(t, "square")
+
+
+@pytest.mark.parametrize("terms", [5, 15, 500])
+def test_fft_coefficients_match_square_wave(terms):
+    # The jumps fall on sample points; the default tol must still be reached (no warning)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        a0, an, bn = fft_coefficients(_square, np.pi, terms)
+    n = np.arange(1, terms + 1)
+    expected_bn = np.where(n % 2 == 1, 4 / (np.pi * n), 0.0)
+    assert abs(a0) < 1e-6
+    assert np.max(np.abs(an)) < 1e-6
+    assert np.max(np.abs(bn - expected_bn)) < 1e-6
+
+
+def test_fft_coefficients_match_sawtooth_wave():
+    a0, an, bn = fft_coefficients(lambda t: target_function(t, "sawtooth"), np.pi, 20)
+    n = np.arange(1, 21)
+    assert np.max(np.abs(an)) < 1e-6
+    assert np.max(np.abs(bn - 2 * (-1.0) ** (n + 1) / (np.pi * n))) < 1e-6
+
+
+def test_fft_coefficients_warn_when_max_n_is_reached():
+    with pytest.warns(RuntimeWarning, match="max_N"):
+        fft_coefficients(_square, np.pi, 50, tol=1e-12, max_N=2 ** 12)
+
+
+def test_synthesize_fft_matches_clenshaw():
+    rng = np.random.default_rng(0)
+    an, bn = rng.standard_normal(20), rng.standard_normal(20)
+    x = np.linspace(-np.pi, np.pi, 1001)
+    fft = synthesize(0.3, an, bn, x, np.pi, method="fft")
+    clenshaw = synthesize(0.3, an, bn, x, np.pi, method="clenshaw")
+    assert np.max(np.abs(fft - clenshaw)) < 1e-10
+
+
+def test_synthesize_auto_skips_oversized_fft(monkeypatch):
+    def no_fft(*args):
+        raise AssertionError("FFT path taken")
+
+    monkeypatch.setattr(fourier_series, "_synthesize_fft", no_fft)
+    # Uniform and dividing the period, but P = 3e9 for 5 points
+    x = np.arange(5) * 2 * np.pi / 3e9
+    values = synthesize(0.0, np.ones(3), np.zeros(3), x, np.pi)
+    assert np.allclose(values, 3 * np.cos(x))
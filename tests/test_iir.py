@@ -0,0 +1,64 @@
+"""
+Difference-equation systems: block streaming against scipy.signal.lfilter, and the
+series / parallel compositions against running the systems one after the other.
+"""
+import numpy as np
+from scipy.signal import lfilter
+
+from sigsys.discrete import DiscreteSignal, LTI_Discrete, LTI_IIR
+
+B, A = [0.2, 0.3, 0.1], [1.0, -0.5, 0.25]
+
+
+def _data(length=2000):
+    return np.random.default_rng(0).standard_normal(length)
+
+
+def _signal(INF=200):
+    signal = DiscreteSignal(INF)
+    signal.values[:] = _data(2 * INF + 1)
+    return signal
+
+
+def test_process_in_blocks_matches_lfilter():
+    data = _data()
+    system = LTI_IIR(B, A)
+    streamed = np.concatenate([system.process(data[start:start + 137]) for start in range(0, len(data), 137)])
+    assert np.max(np.abs(streamed - lfilter(B, A, data))) < 1e-12
+
+
+def test_output_starts_at_rest_and_ignores_the_stream_state():
+    system = LTI_IIR(B, A)
+    system.process(_data())
+    signal = _signal()
+    assert np.max(np.abs(system.output(signal).values - lfilter(B, A, signal.values))) < 1e-12
+
+
+def test_exponential_smoothing():
+    data = _data()
+    system = LTI_IIR.exponential_smoothing(0.1)
+    assert np.max(np.abs(system.process(data) - lfilter([0.1], [1.0, -0.9], data))) < 1e-12
+
+
+def test_series_of_iir_systems():
+    first, second = LTI_IIR(B, A), LTI_IIR([1.0, -1.0], [1.0, 0.9])
+    signal = _signal()
+    expected = second.output(first.output(signal)).values
+    assert np.max(np.abs(first.series(second).output(signal).values - expected)) < 1e-10
+
+
+def test_parallel_of_iir_systems():
+    first, second = LTI_IIR(B, A), LTI_IIR([1.0, -1.0], [1.0, 0.9])
+    signal = _signal()
+    expected = first.output(signal).values + second.output(signal).values
+    assert np.max(np.abs(first.parallel(second).output(signal).values - expected)) < 1e-10
+
+
+def test_iir_with_fir_is_truncated_fir():
+    # The impulse response decays like 0.5^n, so truncating at INF = 200 is exact in float64
+    system = LTI_IIR(B, A)
+    fir = LTI_Discrete(LTI_IIR([1.0, 0.5]).impulse_response(200))
+    combined = system.parallel(fir)
+    assert isinstance(combined, LTI_Discrete)
+    expected = system.impulse_response(200).values + fir.impulse_response.values
+    assert np.max(np.abs(combined.impulse_response.values - expected)) < 1e-12
@@ -0,0 +1,101 @@
+"""
+Pipeline keys: they follow the code of a stage rather than where it is defined, and leave
+runtime-only options out. Defaults and closure values are part of the key.
+"""
+import numpy as np
+import pytest
+
+from sigsys.pipeline import Pipeline
+from sigsys.storage import Store
+
+
+def _key(func, **params):
+    pipeline = Pipeline()
+    pipeline.add("stage", func, **params)
+    return pipeline.key("stage")
+
+
+def test_key_follows_the_code_not_the_module():
+    def scale(value=2):
+        return [value * 3]
+
+    def moved(value=2):
+        return [value * 3]
+
+    def edited(value=2):
+        return [value * 4]
+
+    moved.__module__ = "__main__"
+
+    assert _key(scale, value=2) == _key(moved, value=2)
+    assert _key(scale, value=2) != _key(edited, value=2)
+    assert _key(scale, value=2) != _key(scale, value=5)
+
+
+def test_key_covers_nested_functions():
+    def outer_a():
+        return (lambda x: x + 1)(1)
+
+    def outer_b():
+        return (lambda x: x + 2)(1)
+
+    assert _key(outer_a) != _key(outer_b)
+
+
+def test_runtime_options_are_passed_but_not_keyed():
+    def stage(value, workers=1):
+        return value * workers
+
+    pipeline = Pipeline()
+    pipeline.add("stage", stage, value=3, runtime={"workers": 4})
+    assert pipeline.run("stage") == 12
+    assert pipeline.key("stage") == _key(stage, value=3)
+
+
+def test_key_covers_defaults():
+    def first(value, scale=2):
+        return value * scale
+
+    def second(value, scale=3):
+        return value * scale
+
+    def keyword_only(value, *, scale=2):
+        return value * scale
+
+    def keyword_changed(value, *, scale=3):
+        return value * scale
+
+    assert _key(first, value=1) != _key(second, value=1)
+    assert _key(keyword_only, value=1) != _key(keyword_changed, value=1)
+
+
+def test_key_covers_closures():
+    def make(scale):
+        def stage(value):
+            return value * scale
+        return stage
+
+    assert _key(make(1), value=1) == _key(make(1), value=1)
+    assert _key(make(1), value=1) != _key(make(2), value=1)
+
+
+def test_persisted_stage_is_recomputed_when_a_captured_value_changes(tmp_path):
+    def make(scale):
+        return lambda: np.arange(4.0) * scale
+
+    outputs = []
+    for scale in (1, 2):
+        pipeline = Pipeline(store=Store(str(tmp_path)))
+        pipeline.add("stage", make(scale), persist=True)
+        outputs.append(pipeline.run("stage"))
+    assert np.array_equal(outputs[1], np.arange(4.0) * 2)
+
+
+def test_unhashable_closure_is_rejected():
+    captured = object()
+
+    def stage():
+        return captured
+
+    with pytest.raises(TypeError, match="stage"):
+        _key(stage)
@@ -0,0 +1,73 @@
+"""
+float32 vs float64: how much accuracy the single-precision mode gives up, and that the
+dtype chosen for a signal survives its operations.
+"""
+import numpy as np
+
+from sigsys.discrete import DiscreteSignal, LTI_Discrete
+from sigsys.fourier_series import FourierSeries, target_function
+from sigsys.fourier_transform import fourier_transform, inverse_fourier_transform
+
+
+def _random_signal(INF, dtype, seed=0):
+    signal = DiscreteSignal(INF, dtype)
+    signal.values[:] = np.random.default_rng(seed).standard_normal(2 * INF + 1)
+    return signal
+
+
+def test_discrete_operations_keep_dtype():
+    signal = _random_signal(20, np.float32)
+    assert signal.shift_signal(3).dtype == np.float32
+    assert signal.multiply_const_factor(2.5).dtype == np.float32
+    assert signal.add(_random_signal(20, np.float32, seed=1)).dtype == np.float32
+    # Mixed precision promotes, as NumPy does
+    assert signal.multiply_const_factor(1j).dtype == np.complex64
+    assert DiscreteSignal(2).multiply_const_factor(1j).dtype == np.complex128
+    assert signal.add(_random_signal(20, np.float64, seed=1)).dtype == np.float64
+
+
+def test_lti_discrete_output_float32_error():
+    INF = 50
+    impulse_response = DiscreteSignal(INF)
+    impulse_response.values[INF:INF + 5] = 1 / 5  # moving average
+    input_signal = _random_signal(INF, np.float64)
+
+    output64, _, _ = LTI_Discrete(impulse_response).output(input_signal)
+    output32, _, _ = LTI_Discrete(impulse_response, dtype=np.float32).output(input_signal.astype(np.float32))
+
+    assert output32.dtype == np.float32
+    relative = np.max(np.abs(output32.values - output64.values)) / np.max(np.abs(output64.values))
+    assert relative < 5e-7  # ~5e-8 observed
+
+
+def test_fourier_round_trip_float32_error():
+    sampled_times = np.linspace(-5, 5, 1000)
+    frequencies = np.linspace(-2, 2, 500)
+    signal = np.where(np.abs(sampled_times) <= 2, 1.0, 0.0)
+
+    round_trip = {}
+    for dtype in (np.float64, np.float32):
+        spectrum = fourier_transform(signal, frequencies, sampled_times, dtype=dtype)
+        round_trip[dtype] = inverse_fourier_transform(spectrum, frequencies, sampled_times, dtype=dtype)
+
+    assert round_trip[np.float32].dtype == np.float32
+    assert np.max(np.abs(round_trip[np.float32] - round_trip[np.float64])) < 4e-6  # ~4e-7 observed
+
+
+def test_fourier_series_float32_error():
+    x = np.linspace(-np.pi, np.pi, 1000)
+    func = lambda t: target_function(t, "square")
+    approximation64 = FourierSeries(func, np.pi, 20).approximate(x)
+    approximation32 = FourierSeries(func, np.pi, 20, dtype=np.float32).approximate(x)
+
+    assert approximation32.dtype == np.float32
+    assert np.max(np.abs(approximation32 - approximation64)) < 1e-5  # ~1e-6 observed
+
+
+def test_dtft_float32():
+    signal = _random_signal(500, np.float64)
+    for omega in (None, np.linspace(-3, 3, 777)):
+        spectrum64 = signal.dtft(omega).values
+        spectrum32 = signal.astype(np.float32).dtft(omega).values
+        assert spectrum32.dtype == np.complex64
+        assert np.max(np.abs(spectrum32 - spectrum64)) / np.max(np.abs(spectrum64)) < 1e-6  # ~7e-8 observed
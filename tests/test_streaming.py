@@ -0,0 +1,67 @@
+"""
+Streaming: block filtering equals batch filtering, the latency budget covers the frame
+and filter delay, and dropped frames keep the output aligned.
+"""
+import asyncio
+
+import numpy as np
+import pytest
+
+from sigsys.fir import FIRStream, highpass_taps
+from sigsys.streaming import CollectSink, StreamingHighPass, replay_source, run_stream
+
+SAMPLE_RATE = 8000
+
+
+def _data(length=4000):
+    return np.random.default_rng(0).standard_normal(length)
+
+
+def test_fir_stream_matches_convolve():
+    data = _data()
+    taps = highpass_taps(1000, SAMPLE_RATE, 101)
+    stream = FIRStream(taps)
+    blocks = [stream.process(data[start:start + 300]) for start in range(0, len(data), 300)]
+    assert np.max(np.abs(np.concatenate(blocks) - np.convolve(data, taps)[:len(data)])) < 1e-12
+
+
+def test_run_stream_matches_convolve():
+    data = _data()
+    processor = StreamingHighPass(SAMPLE_RATE, 1000, num_taps=101)
+    sink = CollectSink()
+    stats = asyncio.run(run_stream(replay_source(data, 256, SAMPLE_RATE, realtime=False), sink, processor,
+                                   SAMPLE_RATE, 256, latency_budget=1.0))
+    assert stats.dropped == 0
+    expected = np.convolve(data, processor.taps)[:len(data)]
+    assert np.max(np.abs(sink.to_array() - expected)) < 1e-12
+
+
+def test_budget_below_fixed_delay_is_rejected():
+    # 256 samples at 8 kHz buffer 32 ms before the filter adds its own delay
+    processor = StreamingHighPass(SAMPLE_RATE, 1000, num_taps=101)
+    with pytest.raises(ValueError, match="fixed delay"):
+        asyncio.run(run_stream(replay_source(_data(), 256, SAMPLE_RATE, realtime=False), CollectSink(),
+                               processor, SAMPLE_RATE, 256, latency_budget=0.005))
+
+
+def test_dropped_frames_are_replaced_by_silence():
+    data = _data()
+    processor = StreamingHighPass(SAMPLE_RATE, 1000, num_taps=101)
+    frames = []
+
+    async def slow_sink(frame):
+        frames.append(frame)
+        await asyncio.sleep(0.02)
+
+    # 10 ms left for processing, so the frames queued behind a 20 ms sink arrive late
+    budget = 256 / SAMPLE_RATE + processor.delay / SAMPLE_RATE + 0.01
+    stats = asyncio.run(run_stream(replay_source(data, 256, SAMPLE_RATE, realtime=False), slow_sink,
+                                   processor, SAMPLE_RATE, 256, latency_budget=budget))
+    assert stats.dropped > 0
+    assert stats.summary()["end_to_end_max"] >= stats.fixed_delay
+    output = np.concatenate(frames)
+    assert len(output) == len(data)
+    expected = np.convolve(data, processor.taps)[:len(data)]
+    for index, frame in enumerate(frames):
+        segment = slice(index * 256, index * 256 + len(frame))
+        assert np.allclose(frame, 0) or np.allclose(frame, expected[segment])
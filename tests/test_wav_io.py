@@ -0,0 +1,33 @@
+"""
+WAV loading: memory-mapped 16-bit files and 24-bit files, which cannot be mapped.
+"""
+import wave
+
+import numpy as np
+import scipy.io.wavfile as wavfile
+
+from sigsys.wav_io import load_normalized_mono
+
+SIGNAL = np.sin(np.arange(2000) / 10)
+
+
+def test_load_16_bit(tmp_path):
+    path = str(tmp_path / "16.wav")
+    wavfile.write(path, 8000, np.int16(SIGNAL * 32767))
+    sample_rate, data = load_normalized_mono(path, dtype=np.float64)
+    assert sample_rate == 8000
+    assert np.max(np.abs(data - SIGNAL / np.max(np.abs(SIGNAL)))) < 1e-4
+
+
+def test_load_24_bit(tmp_path):
+    path = str(tmp_path / "24.wav")
+    samples = np.int32(SIGNAL * (2 ** 23 - 1))
+    with wave.open(path, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(3)
+        out.setframerate(8000)
+        out.writeframes(b"".join(int(v).to_bytes(3, "little", signed=True) for v in samples))
+    sample_rate, data = load_normalized_mono(path, step=2, dtype=np.float64)
+    assert sample_rate == 8000
+    expected = (SIGNAL / np.max(np.abs(SIGNAL)))[::2]
+    assert np.max(np.abs(data - expected)) < 1e-6